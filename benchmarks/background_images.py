@@ -0,0 +1,82 @@
+"""
+Measures the render time and the peak memory (over the memory before rendering) of a large photo
+used as a `cover` background of a 1080p card, drawing it straight from the source image (the default) or from a resized copy,
+and of the same photo used as a small avatar (decoded at a reduced scale).
+
+Each mode runs in its own process, since the peak resident memory of a process can only grow.
+The photo is a 24 MP JPEG. The first render decodes it, and the next ones reuse the cached images.
+Run it from the repository root, for example: `python benchmarks/background_images.py`
+"""
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+import numpy as np
+import skia
+
+PHOTO_SIZE = (6000, 4000)  # 24 MP
+CARD_SIZE = (1920, 1080)
+AVATAR_SIZE = (60, 60)
+REPETITIONS = 5
+
+def create_photo(path: str) -> None:
+    width, height = PHOTO_SIZE
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    pixels[..., 0] = x
+    pixels[..., 1] = y
+    pixels[..., 2] = rng.integers(0, 64, (height, width), dtype=np.uint8)
+    pixels[..., 3] = 255
+    skia.Image.fromarray(pixels).save(path, skia.kJPEG)
+
+def get_peak_memory_mb() -> float:
+    # ru_maxrss is in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run(photo_path: str, size: tuple[int, int], sample_images_from_source: bool, results) -> None:
+    from pictex import Canvas, Row
+
+    canvas = Canvas()
+    card = Row().size(*size).background_image(photo_path, size_mode="cover")
+
+    baseline_memory = get_peak_memory_mb()
+    start = time.perf_counter()
+    canvas.render(card, sample_images_from_source=sample_images_from_source)
+    first_render = time.perf_counter() - start
+
+    best = float("inf")
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        canvas.render(card, sample_images_from_source=sample_images_from_source)
+        best = min(best, time.perf_counter() - start)
+
+    results.put((first_render, best, get_peak_memory_mb() - baseline_memory))
+
+def main() -> None:
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        photo_path = os.path.join(directory, "photo.jpg")
+        # The peak memory of a process is inherited by the processes it starts, so the photo is created in its own process
+        process = context.Process(target=create_photo, args=(photo_path,))
+        process.start()
+        process.join()
+
+        cases = [
+            ("card, from source", CARD_SIZE, True),
+            ("card, resized copy", CARD_SIZE, False),
+            ("avatar", AVATAR_SIZE, True),
+        ]
+        print(f"{'mode':>18} {'first render (ms)':>18} {'render (ms)':>12} {'peak memory (MB)':>17}")
+        for label, size, sample_images_from_source in cases:
+            results = context.Queue()
+            process = context.Process(target=run, args=(photo_path, size, sample_images_from_source, results))
+            process.start()
+            first_render, best, peak_memory = results.get()
+            process.join()
+            print(f"{label:>18} {first_render * 1000:>18.1f} {best * 1000:>12.1f} {peak_memory:>17.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Micro-benchmark of the width computation of shaped runs, for lines of 10, 100 and 1000 glyphs.
+
+It compares measuring every glyph of the run with `Font.getWidths()` and summing them in Python,
+against measuring each run with the glyph IDs it already holds (no flattened glyph list),
+reading the runs with `TextBlob.Iter` (`utils.get_text_blob_width()`).
+Run it from the repository root, for example: `python benchmarks/glyph_widths.py`
+"""
+import timeit
+from pathlib import Path
+import skia
+from pictex import utils
+
+FONT_PATH = str(Path(__file__).parent.parent / "tests" / "assets" / "Lato-BoldItalic.ttf")
+
+def glyph_list_width(blob: skia.TextBlob, font: skia.Font) -> float:
+    glyph_ids = [gid for run in list(blob) for gid in run.fGlyphIndices]
+    return sum(font.getWidths(glyph_ids))
+
+def main() -> None:
+    font = skia.Font(skia.Typeface.MakeFromFile(FONT_PATH), 24)
+    font.setLinearMetrics(True)
+    print(f"{'glyphs':>8} {'glyph list (us)':>16} {'per run (us)':>13} {'speedup':>8}")
+    for glyph_count in [10, 100, 1000]:
+        text = ("The quick brown fox jumps over the lazy dog. " * 30)[:glyph_count]
+        blob = skia.TextBlob.MakeFromShapedText(text, font)
+        assert abs(glyph_list_width(blob, font) - utils.get_text_blob_width(blob, font)) < 1e-6
+
+        number = 5000
+        before = timeit.timeit(lambda: glyph_list_width(blob, font), number=number) / number * 1e6
+        after = timeit.timeit(lambda: utils.get_text_blob_width(blob, font), number=number) / number * 1e6
+        print(f"{glyph_count:>8} {before:>16.2f} {after:>13.2f} {before / after:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
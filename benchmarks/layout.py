@@ -0,0 +1,47 @@
+"""
+Measures the layout time (`Node.prepare_tree_for_rendering()`) against the tree size.
+
+The trees are columns of rows with wrapped texts, so width constraints and stretch alignment are exercised.
+Run it from the repository root, for example: `python benchmarks/layout.py`
+"""
+import time
+from pictex import Column, Row, Text
+from pictex.models import RenderProps, CropMode, FontSmoothing
+
+CELLS_PER_ROW = 5
+ROW_COUNTS = [2, 20, 100, 200]
+RENDER_PROPS = RenderProps(is_svg=False, crop_mode=CropMode.NONE, font_smoothing=FontSmoothing.SUBPIXEL)
+
+def build_tree(rows: int) -> Column:
+    return Column(*[
+        Row(*[
+            Text(f"cell {row}.{cell} with some words to wrap").padding(4)
+            for cell in range(CELLS_PER_ROW)
+        ]).gap(8)
+        for row in range(rows)
+    ]).size(width=900).font_size(14).gap(4).horizontal_align("stretch")
+
+def count_nodes(node) -> int:
+    return 1 + sum(count_nodes(child) for child in node.children)
+
+def main() -> None:
+    print(f"{'nodes':>8} {'layout (ms)':>12} {'per node (us)':>14}")
+    for rows in ROW_COUNTS:
+        root = build_tree(rows)._to_node()
+        # The first layout warms up the typeface and shaping caches
+        root.prepare_tree_for_rendering(RENDER_PROPS)
+
+        repetitions = 5
+        best = float("inf")
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            # Unchanged trees aren't laid out again, so the layout is cleared to measure a full one
+            root.clear()
+            root.prepare_tree_for_rendering(RENDER_PROPS)
+            best = min(best, time.perf_counter() - start)
+
+        nodes = count_nodes(root)
+        print(f"{nodes:>8} {best * 1000:>12.2f} {best / nodes * 1e6:>14.1f}")
+
+if __name__ == "__main__":
+    main()
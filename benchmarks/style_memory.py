@@ -0,0 +1,39 @@
+"""
+Measures the memory and time needed to build trees of 10k `Text` elements, and to convert them to nodes.
+
+Run it from the repository root, for example: `python benchmarks/style_memory.py`
+"""
+import time
+import tracemalloc
+from pictex import Column, Row, Text
+
+ROWS = 1000
+CELLS_PER_ROW = 10
+
+def build_tree() -> Column:
+    rows = []
+    for row_index in range(ROWS):
+        cells = [Text(f"cell {row_index}.{cell_index}").padding(4) for cell_index in range(CELLS_PER_ROW)]
+        rows.append(Row(*cells).gap(8))
+    return Column(*rows).font_size(14).color("black")
+
+def measure(label: str, build) -> object:
+    # Time is measured without tracing allocations, since tracing slows down the build a lot
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>10} {ROWS * CELLS_PER_ROW:>10} {current / 2**20:>12.2f} {elapsed * 1000:>10.1f}")
+    return result
+
+def main() -> None:
+    print(f"{'step':>10} {'elements':>10} {'memory (MB)':>12} {'time (ms)':>10}")
+    tree = measure("build", build_tree)
+    measure("to node", tree._to_node)
+
+if __name__ == "__main__":
+    main()
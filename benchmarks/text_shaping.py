@@ -0,0 +1,81 @@
+"""
+Measures the throughput of text shaping on short and long paragraphs,
+with fallback fonts (mixed) and with the primary font only (latin).
+
+The shaping caches are disabled, so every iteration does the whole shaping work.
+Run it from the repository root, for example: `python benchmarks/text_shaping.py`
+"""
+import argparse
+import time
+from pathlib import Path
+from pictex import Style, FontSmoothing
+from pictex.text import FontManager, TextShaper
+
+ASSETS_DIR = Path(__file__).parent.parent / "tests" / "assets"
+FONT_PATH = str(ASSETS_DIR / "Lato-BoldItalic.ttf")
+FALLBACK_FONT_PATH = str(ASSETS_DIR / "FiraCode-Medium.ttf")
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog. ",
+    "Prices start at 9⁴⁹ with free shipping! ",
+    "Follow us for more \U0001F98A updates and ✨ news. ",
+]
+# Only characters of the primary font, without fallbacks
+LATIN_SENTENCES = [
+    "The quick brown fox jumps over the lazy dog. ",
+    "Prices start at 9.49 with free shipping! ",
+]
+
+def build_paragraph(length: int, sentences: list[str] = SENTENCES) -> str:
+    paragraph = ""
+    i = 0
+    while len(paragraph) < length:
+        paragraph += sentences[i % len(sentences)]
+        i += 1
+    return paragraph[:length]
+
+def create_shaper() -> TextShaper:
+    style = Style()
+    style.font_family.set(FONT_PATH)
+    style.font_fallbacks.set([FALLBACK_FONT_PATH])
+    style.font_size.set(24)
+    return TextShaper(style, FontManager(style, FontSmoothing.SUBPIXEL))
+
+def measure(func, min_time: float = 0.1, rounds: int = 5) -> float:
+    """Returns the mean time of a call in the fastest round, in seconds (short calls are noisy)."""
+    func() # warm up (font coverage, system fallbacks, etc.)
+    best = float("inf")
+    for _ in range(rounds):
+        iterations = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < min_time:
+            func()
+            iterations += 1
+        best = min(best, (time.perf_counter() - start) / iterations)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    args = parser.parse_args()
+
+    for cache_name in ["_shaping_cache", "_line_spans_cache", "_line_tokens_cache"]:
+        cache = getattr(TextShaper, cache_name, None)
+        if cache is not None:
+            cache.max_size = 0
+
+    shaper = create_shaper()
+    print(f"{'text':>6} {'chars':>8} {'split spans (ms)':>16} {'shape (ms)':>12} {'wrap (ms)':>12} {'chars/s (shape)':>16}")
+    for text, sentences in [("mixed", SENTENCES), ("latin", LATIN_SENTENCES)]:
+        for length in args.lengths:
+            paragraph = build_paragraph(length, sentences)
+            split_time = measure(lambda: shaper._split_line_in_spans(paragraph))
+            shape_time = measure(lambda: shaper.shape(paragraph))
+            wrap_time = measure(lambda: shaper.shape(paragraph, 400))
+            print(
+                f"{text:>6} {length:>8} {split_time * 1000:>16.3f} {shape_time * 1000:>12.3f} "
+                f"{wrap_time * 1000:>12.3f} {length / shape_time:>16.0f}"
+            )
+
+if __name__ == "__main__":
+    main()
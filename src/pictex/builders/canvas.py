@@ -36,6 +36,7 @@ class Canvas(Stylable, WithSizeMixin):
             crop_mode: CropMode = CropMode.NONE,
             font_smoothing: Union[FontSmoothing, str] = FontSmoothing.SUBPIXEL,
             scale_factor: float = 1.0,
+            sample_images_from_source: bool = True,
     ) -> BitmapImage:
         """Renders an image from the given elements using the configured builders.
 
@@ -49,6 +50,9 @@ class Canvas(Stylable, WithSizeMixin):
                 or `FontSmoothing.STANDARD`.
             scale_factor: Scaling factor for rendering. Values > 1.0 will render the image at 
                 a larger size. All dimensions (width, height, fonts, etc.) are scaled proportionally. Default is 1.0.
+            sample_images_from_source: If `True` (default), background images in `cover`/`contain` mode are
+                drawn straight from the source image into their box. If `False`, a resized copy of the image
+                is created (and cached) first, as before.
 
         Returns:
             An `Image` object containing the rendered result.
@@ -58,7 +62,7 @@ class Canvas(Stylable, WithSizeMixin):
         element = Row(*elements)
         element._style = self._style
         root = element._to_node()
-        return renderer.render_as_bitmap(root, crop_mode, font_smoothing, scale_factor)
+        return renderer.render_as_bitmap(root, crop_mode, font_smoothing, scale_factor, sample_images_from_source)
 
     def render_as_svg(self, *elements: Union[Element, str], embed_font: bool = True) -> VectorImage:
         """Renders the given elements as a scalable vector graphic (SVG).
@@ -27,7 +27,7 @@ class Column(Container):
     """
 
     def _build_node(self, nodes: list[Node]) -> Node:
-        return ColumnNode(self._style, nodes)
+        return ColumnNode(self._style.freeze(), nodes)
 
     def vertical_distribution(self, mode: Union[VerticalDistribution, str]) -> Self:
         """
@@ -82,6 +82,6 @@ class Image(Element, WithSizeMixin):
             height = image.height()
             self.size(width * self._resize_factor, height * self._resize_factor)
 
-        node = RowNode(self._style, [])
+        node = RowNode(self._style.freeze(), [])
         node.rotation = self._rotation
         return node
@@ -27,7 +27,7 @@ class Row(Container):
     """
 
     def _build_node(self, nodes: list[Node]) -> Node:
-        return RowNode(self._style, nodes)
+        return RowNode(self._style.freeze(), nodes)
 
     def horizontal_distribution(self, mode: Union[HorizontalDistribution, str]) -> Self:
         """
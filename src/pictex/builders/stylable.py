@@ -1,4 +1,5 @@
 from __future__ import annotations
+from dataclasses import replace
 from typing import Optional, Union, overload, Literal
 from pathlib import Path
 from ..models import *
@@ -411,11 +412,7 @@ class Stylable:
         Args:
             value: The percentage of brightness (e.g., 100 is normal).
         """
-        effects = self._style.image_effects.get()
-        if not effects:
-            effects = ImageEffects()
-            self._style.image_effects.set(effects)
-        effects.brightness = value
+        self._set_image_effects(brightness=value)
         return self
 
     def contrast(self, value: float) -> Self:
@@ -424,11 +421,7 @@ class Stylable:
         Args:
             value: The percentage of contrast (e.g., 100 is normal).
         """
-        effects = self._style.image_effects.get()
-        if not effects:
-            effects = ImageEffects()
-            self._style.image_effects.set(effects)
-        effects.contrast = value
+        self._set_image_effects(contrast=value)
         return self
 
     def saturation(self, value: float) -> Self:
@@ -437,11 +430,7 @@ class Stylable:
         Args:
             value: The percentage of saturation (e.g., 100 is normal).
         """
-        effects = self._style.image_effects.get()
-        if not effects:
-            effects = ImageEffects()
-            self._style.image_effects.set(effects)
-        effects.saturation = value
+        self._set_image_effects(saturation=value)
         return self
 
     def warmth(self, value: float) -> Self:
@@ -450,13 +439,14 @@ class Stylable:
         Args:
             value: The percentage of warmth (e.g., 0 is no warmth).
         """
-        effects = self._style.image_effects.get()
-        if not effects:
-            effects = ImageEffects()
-            self._style.image_effects.set(effects)
-        effects.warmth = value
+        self._set_image_effects(warmth=value)
         return self
 
+    def _set_image_effects(self, **effects: float) -> None:
+        # Style values are shared with the snapshots of previous renders, so they are replaced instead of modified
+        current_effects = self._style.image_effects.get() or ImageEffects()
+        self._style.image_effects.set(replace(current_effects, **effects))
+
     def _build_color(self, color: Union[str, PaintSource]) -> PaintSource:
         """Internal helper to create a SolidColor from a string.
 
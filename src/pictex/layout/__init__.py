@@ -1 +1,2 @@
 from .size_resolver import SizeResolver
+from .flex_resolver import resolve_flex_widths
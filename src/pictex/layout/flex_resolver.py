@@ -0,0 +1,88 @@
+from typing import Sequence
+import numpy as np
+
+def resolve_flex_widths(bases: Sequence[float], min_widths: Sequence[int], available_width: int) -> list[int]:
+    """
+    Distributes the available width between flexible items, proportionally to their bases.
+    Shares are floored, and the leftover pixels are given to the largest fractional parts (ties are broken by order).
+    Items whose share is lower than their min width are fixed to it, all of them at once,
+    and the rest of the width is distributed again between the others, until no share is lower than its min width.
+
+    Only items with a min width per basis unit higher than the share per basis unit can be below their min width,
+    and fixing items only lowers the share per basis unit. So items are sorted once by that ratio,
+    and each distribution only checks the next items of that order, instead of every item.
+    """
+    item_count = len(bases)
+    if item_count == 0:
+        return []
+
+    base_values = np.asarray(bases, dtype=np.float64)
+    min_values = np.asarray(min_widths, dtype=np.int64)
+    ratios = min_values / base_values
+    order = np.argsort(-ratios, kind='stable').tolist()
+    sorted_ratios = ratios[order].tolist()
+    base_list = base_values.tolist()
+    min_list = min_values.tolist()
+
+    is_fixed = np.zeros(item_count, dtype=bool)
+    remaining_available = int(available_width)
+    # Bases are integer values, so subtracting them from the total is exact
+    total_basis = float(base_values.sum())
+    next_position = 0
+    # Items that were below their min width, but reached it with a leftover pixel
+    rescued: list[int] = []
+
+    def is_below_min(item: int) -> bool:
+        return (base_list[item] / total_basis) * remaining_available < min_list[item]
+
+    while True:
+        below_min = [item for item in rescued if is_below_min(item)]
+        while next_position < item_count and (is_fixed[order[next_position]] or is_below_min(order[next_position])):
+            if not is_fixed[order[next_position]]:
+                below_min.append(order[next_position])
+            next_position += 1
+        # Items with the same ratio as the next one are checked too, since their shares can be rounded differently
+        checked = set(below_min)
+        position = next_position
+        while position < item_count and sorted_ratios[position] == sorted_ratios[next_position]:
+            item = order[position]
+            if not is_fixed[item] and item not in checked and is_below_min(item):
+                below_min.append(item)
+            position += 1
+
+        if not below_min:
+            break
+
+        # A share less than one pixel below its min width reaches it if it gets a leftover pixel
+        allocations = None
+        if any((base_list[item] / total_basis) * remaining_available >= min_list[item] - 1 for item in below_min):
+            allocations = _distribute(base_values, ~is_fixed, total_basis, remaining_available)
+
+        to_fix = [item for item in below_min if allocations is None or allocations[item] < min_list[item]]
+        if not to_fix:
+            break
+
+        rescued = [item for item in below_min if allocations is not None and allocations[item] >= min_list[item]]
+        for item in to_fix:
+            is_fixed[item] = True
+            remaining_available = max(remaining_available - min_list[item], 0)
+            total_basis -= base_list[item]
+
+    allocations = _distribute(base_values, ~is_fixed, total_basis, remaining_available)
+    allocations[is_fixed] = min_values[is_fixed]
+    return allocations.tolist()
+
+def _distribute(bases: np.ndarray, mask: np.ndarray, total_basis: float, available: int) -> np.ndarray:
+    allocations = np.zeros(len(bases), dtype=np.int64)
+    if not mask.any():
+        return allocations
+
+    items = np.flatnonzero(mask)
+    raw_allocations = (bases[items] / total_basis) * available
+    floored = np.floor(raw_allocations)
+    leftover = available - int(floored.sum())
+    if leftover > 0:
+        residuals = raw_allocations - floored
+        floored[np.argsort(-residuals, kind='stable')[:leftover]] += 1
+    allocations[items] = floored
+    return allocations
@@ -15,3 +15,5 @@ class RenderProps:
     is_svg: bool
     crop_mode: CropMode
     font_smoothing: FontSmoothing
+    # Draw scaled images straight from the source image, instead of materializing a resized copy
+    sample_images_from_source: bool = True
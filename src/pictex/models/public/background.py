@@ -18,21 +18,19 @@ class BackgroundImage:
 
     def get_skia_image(self) -> Optional[skia.Image]:
         if self._skia_image is None:
+            # Decoded images are shared across instances (copies of the style), by the process-wide image cache
+            from ...utils.image_cache import load_image
             try:
-                if self.path.startswith("data:image/"):
-                    import base64
-                    _, encoded = self.path.split(",", 1)
-                    data = base64.b64decode(encoded)
-                    self._skia_image = skia.Image.MakeFromEncoded(skia.Data.MakeWithCopy(data))
-                else:
-                    self._skia_image = skia.Image.open(self.path)
+                self._skia_image = load_image(self.path)
             except Exception as e:
-                # print(f"Error loading image: {e}")
                 raise ValueError(f"Could not load background image from: {self.path}")
         return self._skia_image
 
     def __deepcopy__(self, memo):
-        return BackgroundImage(
+        copy = BackgroundImage(
             path=deepcopy(self.path, memo),
             size_mode=deepcopy(self.size_mode, memo)
         )
+        # Images are immutable, so the copy can share the decoded image
+        copy._skia_image = self._skia_image
+        return copy
@@ -1,11 +1,12 @@
-from dataclasses import dataclass, field, fields
-from typing import Optional
+from dataclasses import FrozenInstanceError
+from typing import Optional, Hashable, Any, Union
+from weakref import WeakValueDictionary
 from .border import Border, BorderRadius
 from .background import BackgroundImage
 from .effects import Shadow, OutlineStroke, ImageEffects
 from .layout import Margin, Padding, HorizontalDistribution, VerticalAlignment, HorizontalAlignment, VerticalDistribution
 from .position import Position
-from .style_property import StyleProperty
+from .style_property import StyleField, StyleProperty, to_hashable
 from .typography import TextAlign, FontWeight, FontStyle, TextWrap
 from .paint_source import PaintSource
 from .decoration import TextDecoration
@@ -13,64 +14,185 @@ from .color import SolidColor
 from .size import SizeValue
 
 
-@dataclass
 class Style:
     """
     A comprehensive container for all text styling properties.
     This is the core data model for the library.
+
+    Values are stored in a single sequence shared with the default values until the first property is set,
+    and the properties that were explicitly set are tracked in a bitmask.
+    Properties can be passed as keyword arguments or assigned, with plain values or with the properties of another style
+    (e.g. `Style(font_size=40)` or `style.color = other.color`).
     """
+    __slots__ = ("_values", "_was_set_mask", "_value_keys", "_hash", "__weakref__")
+
     # Properties that can be inherited.
-    font_family: StyleProperty[Optional[str]] = field(default_factory=lambda: StyleProperty(None))
-    font_fallbacks: StyleProperty[list[str]] = field(default_factory=lambda: StyleProperty([]))
-    font_size: StyleProperty[float] = field(default_factory=lambda: StyleProperty(50))
-    font_weight: StyleProperty[FontWeight] = field(default_factory=lambda: StyleProperty(FontWeight.NORMAL))
-    font_style: StyleProperty[FontStyle] = field(default_factory=lambda: StyleProperty(FontStyle.NORMAL))
-    line_height: StyleProperty[float] = field(default_factory=lambda: StyleProperty(1.0))  # Multiplier for the font size, like in CSS
-    text_align: StyleProperty[TextAlign] = field(default_factory=lambda: StyleProperty(TextAlign.LEFT))
-    color: StyleProperty[PaintSource] = field(default_factory=lambda: StyleProperty(SolidColor(0, 0, 0)))
-    text_shadows: StyleProperty[list[Shadow]] = field(default_factory=lambda: StyleProperty([]))
-    text_stroke: StyleProperty[Optional[OutlineStroke]] = field(default_factory=lambda: StyleProperty(None))
-    underline: StyleProperty[Optional[TextDecoration]] = field(default_factory=lambda: StyleProperty(None))
-    strikethrough: StyleProperty[Optional[TextDecoration]] = field(default_factory=lambda: StyleProperty(None))
-    text_wrap: StyleProperty[TextWrap] = field(default_factory=lambda: StyleProperty(TextWrap.NORMAL))
+    font_family: StyleField[Optional[str]] = StyleField(None)
+    font_fallbacks: StyleField[list[str]] = StyleField([])
+    font_size: StyleField[float] = StyleField(50)
+    font_weight: StyleField[FontWeight] = StyleField(FontWeight.NORMAL)
+    font_style: StyleField[FontStyle] = StyleField(FontStyle.NORMAL)
+    line_height: StyleField[float] = StyleField(1.0)  # Multiplier for the font size, like in CSS
+    text_align: StyleField[TextAlign] = StyleField(TextAlign.LEFT)
+    color: StyleField[PaintSource] = StyleField(SolidColor(0, 0, 0))
+    text_shadows: StyleField[list[Shadow]] = StyleField([])
+    text_stroke: StyleField[Optional[OutlineStroke]] = StyleField(None)
+    underline: StyleField[Optional[TextDecoration]] = StyleField(None)
+    strikethrough: StyleField[Optional[TextDecoration]] = StyleField(None)
+    text_wrap: StyleField[TextWrap] = StyleField(TextWrap.NORMAL)
 
     # Properties that cannot be inherited.
-    box_shadows: StyleProperty[list[Shadow]] = field(default_factory=lambda: StyleProperty([], inheritable=False))
-    padding: StyleProperty[Padding] = field(default_factory=lambda: StyleProperty(Padding(), inheritable=False))
-    margin: StyleProperty[Margin] = field(default_factory=lambda: StyleProperty(Margin(), inheritable=False))
-    background_color: StyleProperty[Optional[PaintSource]] = field(default_factory=lambda: StyleProperty(None, inheritable=False))
-    background_image: StyleProperty[Optional[BackgroundImage]] = field(default_factory=lambda: StyleProperty(None, inheritable=False))
-    image_effects: StyleProperty[Optional[ImageEffects]] = field(default_factory=lambda: StyleProperty(None, inheritable=False))
-    border: StyleProperty[Optional[Border]] = field(default_factory=lambda: StyleProperty(None, inheritable=False))
-    border_radius: StyleProperty[Optional[BorderRadius]] = field(default_factory=lambda: StyleProperty(None, inheritable=False))
-    position: StyleProperty[Optional[Position]] = field(default_factory=lambda: StyleProperty(None, inheritable=False))
-    width: StyleProperty[Optional[SizeValue]] = field(default_factory=lambda: StyleProperty(None, inheritable=False))
-    height: StyleProperty[Optional[SizeValue]] = field(default_factory=lambda: StyleProperty(None, inheritable=False))
-    horizontal_distribution: StyleProperty[HorizontalDistribution] = field(
-        default_factory=lambda: StyleProperty(HorizontalDistribution.LEFT, inheritable=False)
-    )
-    vertical_alignment: StyleProperty[VerticalAlignment] = field(
-        default_factory=lambda: StyleProperty(VerticalAlignment.TOP, inheritable=False)
-    )
-    vertical_distribution: StyleProperty[VerticalDistribution] = field(
-        default_factory=lambda: StyleProperty(VerticalDistribution.TOP, inheritable=False)
-    )
-    horizontal_alignment: StyleProperty[HorizontalAlignment] = field(
-        default_factory=lambda: StyleProperty(HorizontalAlignment.LEFT, inheritable=False)
-    )
-    gap: StyleProperty[float] = field(default_factory=lambda: StyleProperty(0.0, inheritable=False))
+    box_shadows: StyleField[list[Shadow]] = StyleField([], inheritable=False)
+    padding: StyleField[Padding] = StyleField(Padding(), inheritable=False)
+    margin: StyleField[Margin] = StyleField(Margin(), inheritable=False)
+    background_color: StyleField[Optional[PaintSource]] = StyleField(None, inheritable=False)
+    background_image: StyleField[Optional[BackgroundImage]] = StyleField(None, inheritable=False)
+    image_effects: StyleField[Optional[ImageEffects]] = StyleField(None, inheritable=False)
+    border: StyleField[Optional[Border]] = StyleField(None, inheritable=False)
+    border_radius: StyleField[Optional[BorderRadius]] = StyleField(None, inheritable=False)
+    position: StyleField[Optional[Position]] = StyleField(None, inheritable=False)
+    width: StyleField[Optional[SizeValue]] = StyleField(None, inheritable=False)
+    height: StyleField[Optional[SizeValue]] = StyleField(None, inheritable=False)
+    horizontal_distribution: StyleField[HorizontalDistribution] = StyleField(HorizontalDistribution.LEFT, inheritable=False)
+    vertical_alignment: StyleField[VerticalAlignment] = StyleField(VerticalAlignment.TOP, inheritable=False)
+    vertical_distribution: StyleField[VerticalDistribution] = StyleField(VerticalDistribution.TOP, inheritable=False)
+    horizontal_alignment: StyleField[HorizontalAlignment] = StyleField(HorizontalAlignment.LEFT, inheritable=False)
+    gap: StyleField[float] = StyleField(0.0, inheritable=False)
+
+    def __init__(self, **properties: Any) -> None:
+        # The default values are copied on the first write
+        self._values: Union[tuple, list] = _DEFAULT_VALUES
+        self._was_set_mask = 0
+        # Only snapshots (see freeze()) have value keys and hash
+        self._value_keys: tuple[Hashable, ...] = _DEFAULT_VALUE_KEYS
+        self._hash: Optional[int] = None
+        for name, value in properties.items():
+            if name not in _FIELDS_BY_NAME:
+                raise TypeError(f"Style() got an unexpected keyword argument '{name}'")
+            setattr(self, name, value)
 
     def is_explicit(self, field_name: str) -> bool:
-        property: Optional[StyleProperty] = getattr(self, field_name)
-        if not property:
-            raise ValueError(f"Field '{field_name}' doesn't exist.")
-        return property.was_set
+        return bool(self._was_set_mask & _get_field(field_name).bit)
 
     def is_inheritable(self, field_name: str) -> bool:
-        property: Optional[StyleProperty] = getattr(self, field_name)
-        if not property:
-            raise ValueError(f"Field '{field_name}' doesn't exist.")
-        return property.is_inheritable
+        return _get_field(field_name).inheritable
 
     def get_field_names(self) -> list[str]:
-        return [f.name for f in fields(self)]
+        return [field.name for field in _FIELDS]
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._hash is not None
+
+    def freeze(self) -> "Style":
+        """
+        Returns an immutable and hashable snapshot of the style (or the style itself, if it's already a snapshot).
+        Snapshots are interned: identical styles share a single object, so they are cheap cache keys.
+        """
+        if self._hash is not None:
+            return self
+
+        value_keys = list(_DEFAULT_VALUE_KEYS)
+        for field in _get_fields_in_mask(self._was_set_mask):
+            value_keys[field.index] = to_hashable(self._values[field.index])
+        return Style._intern(self._values, self._was_set_mask, tuple(value_keys))
+
+    def inherit_from(self, parent: "Style") -> "Style":
+        """
+        Returns a snapshot of the style, where the inheritable properties that were not explicitly set
+        are taken from the parent snapshot. Values are shared with both styles, they aren't copied.
+        """
+        own = self.freeze()
+        parent = parent.freeze()
+        inherited_mask = parent._was_set_mask & _INHERITABLE_MASK & ~own._was_set_mask
+        if not inherited_mask:
+            # Non-explicit values are the defaults for both styles
+            return own
+
+        values = list(own._values)
+        value_keys = list(own._value_keys)
+        for field in _get_fields_in_mask(inherited_mask):
+            values[field.index] = parent._values[field.index]
+            value_keys[field.index] = parent._value_keys[field.index]
+        return Style._intern(values, own._was_set_mask | inherited_mask, tuple(value_keys))
+
+    @staticmethod
+    def _intern(values: Union[tuple, list], was_set_mask: int, value_keys: tuple[Hashable, ...]) -> "Style":
+        key = (was_set_mask, value_keys)
+        snapshot = _interned_styles.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        snapshot = Style()
+        snapshot._values = tuple(values)
+        snapshot._was_set_mask = was_set_mask
+        snapshot._value_keys = value_keys
+        snapshot._hash = hash(key)
+        return _interned_styles.setdefault(key, snapshot)
+
+    def _set_value(self, field: StyleField, value: Any, was_set: bool) -> None:
+        if self._hash is not None:
+            raise FrozenInstanceError(f"Cannot modify the property '{field.name}' of a frozen style.")
+        values = self._values
+        if not isinstance(values, list):
+            values = self._values = list(values)
+        values[field.index] = value
+        if was_set:
+            self._was_set_mask |= field.bit
+        else:
+            self._was_set_mask &= ~field.bit
+
+    def __copy__(self) -> "Style":
+        if self._hash is not None:
+            return self
+        style = Style()
+        if self._values is not _DEFAULT_VALUES:
+            style._values = list(self._values)
+        style._was_set_mask = self._was_set_mask
+        return style
+
+    def __deepcopy__(self, memo: dict) -> "Style":
+        # Values are never modified in place (see StyleProperty.get()), so they can be shared by the copies
+        return self.__copy__()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Style):
+            return NotImplemented
+        return self._was_set_mask == other._was_set_mask and list(self._values) == list(other._values)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            raise TypeError("unhashable type: 'Style' (use freeze() to get a hashable snapshot)")
+        return self._hash
+
+    def __repr__(self) -> str:
+        set_values = ", ".join(
+            f"{field.name}={self._values[field.index]!r}" for field in _get_fields_in_mask(self._was_set_mask)
+        )
+        return f"Style({set_values})"
+
+_FIELDS: tuple[StyleField, ...] = tuple(value for value in vars(Style).values() if isinstance(value, StyleField))
+for _index, _field in enumerate(_FIELDS):
+    _field.index = _index
+    _field.bit = 1 << _index
+_FIELDS_BY_NAME = {field.name: field for field in _FIELDS}
+_DEFAULT_VALUES = tuple(field.default for field in _FIELDS)
+# Properties that were not set hold the default value, so they don't need to be hashed
+_DEFAULT_VALUE_KEYS: tuple[Hashable, ...] = (None,) * len(_FIELDS)
+_INHERITABLE_MASK = sum(field.bit for field in _FIELDS if field.inheritable)
+# Snapshots by structural key. They are weakly referenced, so unused snapshots are released
+_interned_styles: WeakValueDictionary[Hashable, Style] = WeakValueDictionary()
+
+def _get_field(field_name: str) -> StyleField:
+    field = _FIELDS_BY_NAME.get(field_name)
+    if not field:
+        raise ValueError(f"Field '{field_name}' doesn't exist.")
+    return field
+
+def _get_fields_in_mask(mask: int) -> list[StyleField]:
+    fields = []
+    while mask:
+        bit = mask & -mask
+        fields.append(_FIELDS[bit.bit_length() - 1])
+        mask ^= bit
+    return fields
@@ -1,21 +1,67 @@
-from typing import TypeVar, Generic
+from dataclasses import fields, is_dataclass
+from typing import TypeVar, Generic, Hashable, Any, Optional, overload, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .style import Style
 
 T = TypeVar("T")
 
-class StyleProperty(Generic[T]):
+class StyleField(Generic[T]):
+    """
+    Declares a property of `Style`. The default value is shared by every style, so it must never be modified.
+    Accessing the field on a style returns a `StyleProperty` bound to that style.
+    """
+    __slots__ = ("name", "index", "bit", "default", "inheritable")
+
     def __init__(self, default: T, inheritable: bool = True):
-        self._value = default
-        self._default = default
-        self._inheritable = inheritable
-        self._was_set = False
+        self.name = ""
+        self.index = -1
+        self.bit = 0
+        self.default = default
+        self.inheritable = inheritable
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, style: None, owner: type) -> "StyleField[T]": ...
+    @overload
+    def __get__(self, style: "Style", owner: type) -> "StyleProperty[T]": ...
+    def __get__(self, style: Optional["Style"], owner: type):
+        if style is None:
+            return self
+        return StyleProperty(style, self)
+
+    def __set__(self, style: "Style", value: Any) -> None:
+        # Assigning a property of another style copies its value and 'was set' flag,
+        # assigning a plain value is the same as calling set()
+        if isinstance(value, StyleProperty):
+            style._set_value(self, value.get(), value.was_set)
+        else:
+            style._set_value(self, value, True)
+
+class StyleProperty(Generic[T]):
+    """
+    A lightweight view of a property of a style.
+    Values and 'was set' flags are stored in the style, so these objects are cheap to create on each access.
+    """
+    __slots__ = ("_style", "_field")
+
+    def __init__(self, style: "Style", field: StyleField[T]):
+        self._style = style
+        self._field = field
 
     @property
-    def was_set(self):
-        return self._was_set
+    def was_set(self) -> bool:
+        return bool(self._style._was_set_mask & self._field.bit)
 
     @property
     def is_inheritable(self) -> bool:
-        return self._inheritable
+        return self._field.inheritable
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._style.is_frozen
 
     def get(self) -> T:
         """
@@ -24,21 +70,37 @@ class StyleProperty(Generic[T]):
         For example, if get() returns a list, you can't modify the returned list internal state directly,
         you must create a new instance and call set() with the new value.
         """
-        return self._value
+        return self._style._values[self._field.index]
 
     def set(self, new_value: T):
-        self._value = new_value
-        self._was_set = True
+        self._style._set_value(self._field, new_value, True)
 
     def reset(self):
-        self._value = self._default
-        self._was_set = False
+        self._style._set_value(self._field, self._field.default, False)
 
     def __call__(self) -> T:
-        return self._value
+        return self.get()
 
     def __repr__(self):
-        return f"{self._value} (set={self._was_set}, inheritable={self._inheritable})"
+        return f"{self.get()} (set={self.was_set}, inheritable={self.is_inheritable})"
 
     def __eq__(self, other):
-        return self._value == other
+        return self.get() == other
+
+def to_hashable(value: Any) -> Hashable:
+    """Returns a hashable key for a style value, comparing mutable values (lists, dataclasses) structurally."""
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(to_hashable(item) for item in value))
+    if type(value).__hash__ is not None:
+        try:
+            hash(value)
+            return (type(value), value)
+        except TypeError:
+            pass
+    if is_dataclass(value) and not isinstance(value, type):
+        # Private fields are caches (e.g. the decoded image of a background), they aren't part of the value
+        return (type(value), tuple(
+            to_hashable(getattr(value, field.name)) for field in fields(value) if not field.name.startswith("_")
+        ))
+    # The snapshot keeps the value alive, so its id can't be reused while the key exists
+    return (type(value), id(value))
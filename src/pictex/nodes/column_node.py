@@ -21,6 +21,9 @@ class ColumnNode(ContainerNode):
         border = self.computed_styles.border.get()
         border_width = border.width if border else 0
         horizontal_spacing = padding.left + padding.right + (border_width * 2) + margin.left + margin.right
+        if self._has_absolute_width():
+            # It doesn't depend on the children, so they can change without laying out the ancestors
+            return self.content_width + horizontal_spacing
 
         if not children:
             return horizontal_spacing
@@ -42,7 +45,7 @@ class ColumnNode(ContainerNode):
             if child_width and child_width.mode != SizeValueMode.AUTO:
                 continue
 
-            child._forced_size = (self.content_width, self._forced_size[1])
+            child._set_forced_size((self.content_width, self._forced_size[1]))
 
     def _apply_fill_available_constraints(self):
         """
@@ -68,7 +71,7 @@ class ColumnNode(ContainerNode):
         space_per_flexible_child = max(0, remaining_space / len(flexible_children))
 
         for child in flexible_children:
-            child._forced_size = (self._forced_size[0], space_per_flexible_child)
+            child._set_forced_size((self._forced_size[0], space_per_flexible_child))
 
     def compute_intrinsic_width(self) -> int:
         children = self._get_positionable_children()
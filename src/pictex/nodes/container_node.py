@@ -1,7 +1,8 @@
 from typing import Tuple, Callable
 from .node import Node
+from ..utils import cached_property
 from ..painters import Painter, BackgroundPainter, BorderPainter
-from ..models import Style
+from ..models import Style, SizeValueMode
 import skia
 
 class ContainerNode(Node):
@@ -11,6 +12,27 @@ class ContainerNode(Node):
         self._set_children(children)
         self.clear()
 
+    def _is_relayout_boundary(self) -> bool:
+        # The size of a container with absolute width and height only depends on its styles,
+        #  and its parent doesn't constrain nor force it
+        return super()._is_relayout_boundary() or (self._has_absolute_width() and self._has_absolute_height())
+
+    def _has_absolute_width(self) -> bool:
+        width = self.computed_styles.width.get()
+        return width is not None and width.mode == SizeValueMode.ABSOLUTE
+
+    def _has_absolute_height(self) -> bool:
+        height = self.computed_styles.height.get()
+        return height is not None and height.mode == SizeValueMode.ABSOLUTE
+
+    @cached_property(group='bounds')
+    def children_relative_positions(self) -> list[Tuple[float, float]]:
+        """
+        The position of the margin box of each child placed by the layout, relative to the node box.
+        It's computed once the node is arranged, and shared by the paint bounds and absolute positions.
+        """
+        return self._calculate_children_relative_positions(self._get_positionable_children(), lambda node: node.margin_bounds)
+
     def _calculate_children_relative_positions(self, children: list[Node], get_child_bounds: Callable[[Node], skia.Rect]) -> list[Tuple[float, float]]:
         raise NotImplementedError()
     
@@ -18,7 +40,7 @@ class ContainerNode(Node):
         paint_bounds = skia.Rect.MakeEmpty()
 
         children = self._get_positionable_children()
-        positions = self._calculate_children_relative_positions(children, lambda node: node.margin_bounds)
+        positions = self.children_relative_positions
         for i, child in enumerate(children):
             position = positions[i]
             child_bounds_shifted = child.paint_bounds.makeOffset(position[0], position[1])
@@ -33,7 +55,9 @@ class ContainerNode(Node):
             raise RuntimeError("Unexpected error: self._render_props is not defined. Parent node should initialize this dependency.")
 
         return [
-            BackgroundPainter(self.computed_styles, self.border_bounds, self._render_props.is_svg),
+            BackgroundPainter(
+                self.computed_styles, self.border_bounds, self._render_props.is_svg, self._render_props.sample_images_from_source
+            ),
             BorderPainter(self.computed_styles, self.border_bounds),
         ]
 
@@ -45,7 +69,7 @@ class ContainerNode(Node):
         
         x, y = absolute_position
         positionable_children = self._get_positionable_children()
-        positions = self._calculate_children_relative_positions(positionable_children, lambda node: node.margin_bounds)
+        positions = self.children_relative_positions
         for i, child in enumerate(positionable_children):
             position = positions[i]
             child._setup_absolute_position(x + position[0], y + position[1])
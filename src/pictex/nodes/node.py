@@ -1,5 +1,4 @@
 from __future__ import annotations
-from copy import deepcopy
 from typing import Optional, Tuple
 import skia
 from ..models import Style, Shadow, PositionMode, RenderProps, CropMode
@@ -17,6 +16,9 @@ class Node(Cacheable):
         self._render_props: Optional[RenderProps] = None
         self._absolute_position: Optional[Tuple[float, float]] = None
         self._forced_size: Tuple[Optional[int], Optional[int]] = (None, None)
+        # Dirty flags: the subtree must be laid out again, or some descendant subtree must
+        self._needs_layout = True
+        self._has_dirty_descendants = False
 
     @property
     def parent(self) -> Optional[Node]:
@@ -66,7 +68,7 @@ class Node(Cacheable):
     def content_bounds(self) -> skia.Rect:
         return to_int_skia_rect(skia.Rect.MakeWH(self.content_width, self.content_height))
 
-    @cached_property(group='bounds')
+    @cached_property(group='paint_bounds')
     def paint_bounds(self) -> skia.Rect:
         return to_int_skia_rect(self._compute_paint_bounds())
 
@@ -143,16 +145,96 @@ class Node(Cacheable):
         """
         Prepares the node and its children to be rendered.
         It's meant to be called in the root node.
+
+        The tree can be rendered again after changing it (see set_style() and TextNode.set_text()):
+        only the subtrees whose layout can be affected by the changes are laid out again,
+        the rest of nodes keep their computed styles, shaped lines and bounds.
         """
-        self.clear()
-        self._init_render_dependencies(render_props)
-        self._set_width_constraint(None)
-        self._clear_bounds()
-        self._before_calculating_bounds()
-        self._clear_bounds()
-        self._calculate_bounds()
+        if render_props != self._render_props:
+            # Fonts and paint bounds depend on the render props, so nothing can be reused
+            self.clear()
+            self._init_render_dependencies(render_props)
+        self._update_layout()
         self._setup_absolute_position()
 
+    def set_style(self, style: Style) -> None:
+        """
+        Replaces the style of the node. It takes effect on the next render of this node tree.
+
+        Only trees that are rendered again benefit from the incremental relayout: `Canvas.render()` builds a new
+        node tree on every call, so this is only useful when the nodes are kept and rendered directly.
+        The layout is computed again from the closest ancestor with absolute width and height
+        (or from the root, if there is none), since the size of the node can change.
+        """
+        self._raw_style = style.freeze()
+        # The computed styles of the descendants and the render dependencies depend on this style
+        render_props = self._render_props
+        self.clear()
+        if render_props:
+            self._init_render_dependencies(render_props)
+        if self._parent:
+            # The position of the node decides how its parent places it
+            self._parent.clear_cache('children')
+        # The node size can change even if it's a relayout boundary, so the parent must be laid out again
+        (self._parent or self)._mark_layout_dirty()
+
+    def _mark_layout_dirty(self) -> None:
+        """
+        Schedules the layout of the closest relayout boundary containing this node,
+        since the size of every node in between can depend on this node size.
+        """
+        boundary = self
+        while boundary._parent and not boundary._is_relayout_boundary():
+            boundary = boundary._parent
+        boundary._needs_layout = True
+
+        ancestor = boundary._parent
+        while ancestor and not ancestor._has_dirty_descendants:
+            ancestor._has_dirty_descendants = True
+            ancestor = ancestor._parent
+
+    def _is_relayout_boundary(self) -> bool:
+        """
+        Returns whether the size of the node can't depend on its descendants nor on its parent layout.
+        Changes inside a relayout boundary don't need to lay out its ancestors.
+        """
+        return self._parent is None
+
+    def _update_layout(self) -> None:
+        if self._needs_layout:
+            self._reset_layout()
+            # Measure: width constraints and forced sizes are resolved top-down, and nodes are measured bottom-up on demand.
+            #  Changing the layout inputs of a node only invalidates the bounds depending on them (see _invalidate_layout()),
+            #  so every other bound is measured once.
+            self._set_width_constraint(None)
+            self._before_calculating_bounds()
+            # Arrange
+            self._calculate_bounds()
+            return
+
+        if not self._has_dirty_descendants:
+            return
+
+        self._has_dirty_descendants = False
+        for child in self._children:
+            child._update_layout()
+        # The size of the node didn't change, but the descendants can paint in a different area.
+        #  The bounds are already arranged, so the new paint bounds don't need to be offset
+        self.clear_cache('paint_bounds')
+
+    def _reset_layout(self) -> None:
+        """
+        Resets the layout inputs and bounds of the subtree, keeping the computed styles and render dependencies.
+        """
+        for child in self._children:
+            child._reset_layout()
+
+        self._needs_layout = False
+        self._has_dirty_descendants = False
+        self._forced_size = (None, None)
+        self.clear_cache('bounds')
+        self.clear_cache('paint_bounds')
+
     def _init_render_dependencies(self, render_props: RenderProps) -> None:
         self._render_props = render_props
         for child in self._children:
@@ -168,12 +250,15 @@ class Node(Cacheable):
             bound.offset(offset_x, offset_y)
 
     def _get_all_bounds(self) -> list[skia.Rect]:
+        """
+        Returns the layout bounds, the ones that are offset when the node is arranged.
+        Paint bounds are computed from the arranged bounds (and children positions), so they are already in place.
+        """
         return [
             self.content_bounds,
             self.padding_bounds,
             self.border_bounds,
             self.margin_bounds,
-            self.paint_bounds,
         ]
 
     def _setup_absolute_position(self, x: float = 0, y: float = 0) -> None:
@@ -233,8 +318,31 @@ class Node(Cacheable):
         self._render_props = None
         self._absolute_position = None
         self._forced_size = (None, None)
+        self._needs_layout = True
+        self._has_dirty_descendants = False
         self.clear_cache()
 
+    def _set_forced_size(self, forced_size: Tuple[Optional[int], Optional[int]]) -> None:
+        if forced_size == self._forced_size:
+            return
+        self._forced_size = forced_size
+        self._invalidate_layout()
+
+    def _invalidate_layout(self) -> None:
+        """
+        Invalidates the bounds depending on the layout inputs of this node (like its forced size):
+        its own bounds, the ones of its descendants (they can depend on its size)
+        and the ones of its ancestors up to the closest relayout boundary (their size can depend on this node size).
+        """
+        self._clear_bounds()
+        ancestor = self._parent
+        while ancestor:
+            ancestor.clear_cache('bounds')
+            ancestor.clear_cache('paint_bounds')
+            if ancestor._is_relayout_boundary():
+                break
+            ancestor = ancestor._parent
+
     def _clear_bounds(self):
         """
         Resets only the calculated layout and bounds information.
@@ -244,24 +352,17 @@ class Node(Cacheable):
             child._clear_bounds()
 
         self.clear_cache('bounds')
+        self.clear_cache('paint_bounds')
 
     def _compute_styles(self) -> Style:
-        parent_computed_styles = self._parent.computed_styles if self._parent else None
-        computed_styles = deepcopy(self._raw_style)
-        if not parent_computed_styles:
-            return computed_styles
-
-        field_names = computed_styles.get_field_names()
-        for field_name in field_names:
-            if not computed_styles.is_inheritable(field_name):
-                continue
-            if computed_styles.is_explicit(field_name):
-                continue
-
-            parent_field_value = deepcopy(getattr(parent_computed_styles, field_name))
-            setattr(computed_styles, field_name, parent_field_value)
-
-        return computed_styles
+        """
+        Computes the styles as an interned snapshot: it shares the property objects of the raw style
+        (explicit values) and of the parent computed styles (inherited values), so nothing is copied.
+        Nodes with the same raw style and parent styles share the same computed styles object.
+        """
+        if not self._parent:
+            return self._raw_style.freeze()
+        return self._raw_style.inherit_from(self._parent.computed_styles)
 
     def _compute_shadow_bounds(self, source_bounds: skia.Rect, shadows: list[Shadow]) -> skia.Rect:
         # I don't like this. It only makes sense because it is only being used by paint bounds calculation
@@ -278,6 +379,7 @@ class Node(Cacheable):
         for node in nodes:
             node._parent = self
         self._children = nodes
+        self.clear_cache('children')
 
     def _get_root(self) -> Node:
         root = self
@@ -285,11 +387,26 @@ class Node(Cacheable):
             root = root._parent
         return root
 
+    @cached_property(group='children')
+    def _children_partition(self) -> Tuple[list[Node], list[Node]]:
+        """
+        Splits the children in the ones placed by the layout and the ones with a position, in a single pass.
+        The lists are shared by every caller, so they mustn't be modified.
+        """
+        positionable_children: list[Node] = []
+        non_positionable_children: list[Node] = []
+        for child in self._children:
+            if child.computed_styles.position.get() is None:
+                positionable_children.append(child)
+            else:
+                non_positionable_children.append(child)
+        return positionable_children, non_positionable_children
+
     def _get_positionable_children(self) -> list[Node]:
-        return [child for child in self.children if child.computed_styles.position.get() is None]
+        return self._children_partition[0]
     
     def _get_non_positionable_children(self) -> list[Node]:
-        return [child for child in self.children if child.computed_styles.position.get() is not None]
+        return self._children_partition[1]
 
     def _before_calculating_bounds(self) -> None:
         """
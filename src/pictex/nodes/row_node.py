@@ -1,9 +1,9 @@
-from typing import Optional, Tuple, Callable, List, Dict
+from typing import Optional, Tuple, Callable, List
 from .container_node import ContainerNode
 from .node import Node
 from ..models import VerticalAlignment, HorizontalDistribution, SizeValueMode
+from ..layout import resolve_flex_widths
 import skia
-import math
 
 class RowNode(ContainerNode):
 
@@ -35,67 +35,33 @@ class RowNode(ContainerNode):
         if not children_with_flexible_width:
             return
 
-        bases: Dict[Node, float] = {}
-        mins: Dict[Node, int] = {}
+        bases: List[float] = []
+        mins: List[int] = []
         for child in children_with_flexible_width:
             basis = float(child.margin_bounds.width())
-            if basis <= 0:
-                basis = 1.0
-            bases[child] = basis
-            mins[child] = int(round(child.compute_min_width() or 0))
-
-        remaining = set(children_with_flexible_width)
-        remaining_available = int(available_for_children)
-
-        while remaining:
-            total_basis = sum(bases[c] for c in remaining)
-            raw_allocs = {c: (bases[c] / total_basis) * remaining_available for c in remaining}
-            allocations = {c: int(math.floor(raw_allocs[c])) for c in remaining}
-
-            allocated_sum = sum(allocations.values())
-            leftover = remaining_available - allocated_sum
-            if leftover > 0:
-                residuals = sorted(
-                    remaining,
-                    key=lambda c: (raw_allocs[c] - math.floor(raw_allocs[c])),
-                    reverse=True
-                )
-                for c in residuals[:leftover]:
-                    allocations[c] += 1
-
-            bumped = False
-            to_fix = []
-            for c in list(remaining):
-                alloc = allocations.get(c, 0)
-                minw = mins[c]
-                if alloc < minw:
-                    to_fix.append((c, minw))
-                    bumped = True
-
-            if not bumped:
-                for c in remaining:
-                    child_alloc = int(allocations[c])
-                    c._set_width_constraint(child_alloc)
-                break
-            else:
-                for (c, minw) in to_fix:
-                    c._set_width_constraint(int(minw))
-                    remaining_available = max(remaining_available - int(minw), 0)
-                    remaining.remove(c)
+            bases.append(basis if basis > 0 else 1.0)
+            mins.append(int(round(child.compute_min_width() or 0)))
+
+        allocations = resolve_flex_widths(bases, mins, int(available_for_children))
+        for child, allocation in zip(children_with_flexible_width, allocations):
+            child._set_width_constraint(allocation)
     
     def compute_min_width(self) -> int:
+        margin = self.computed_styles.margin.get()
+        padding = self.computed_styles.padding.get()
+        border = self.computed_styles.border.get()
+        border_width = border.width if border else 0
+        horizontal_spacing = padding.left + padding.right + (border_width * 2) + margin.left + margin.right
+        if self._has_absolute_width():
+            # It doesn't depend on the children, so they can change without laying out the ancestors
+            return self.content_width + horizontal_spacing
+
         children = self._get_positionable_children()
         gap = self.computed_styles.gap.get()
         total_gap = gap * (len(children) - 1) if len(children) > 1 else 0
         min_width = total_gap
         for child in children:
             min_width += child.compute_min_width()
-        
-        margin = self.computed_styles.margin.get()
-        padding = self.computed_styles.padding.get()
-        border = self.computed_styles.border.get()
-        border_width = border.width if border else 0
-        horizontal_spacing = padding.left + padding.right + (border_width * 2) + margin.left + margin.right
         return min_width + horizontal_spacing
 
     def compute_intrinsic_width(self) -> int:
@@ -129,7 +95,7 @@ class RowNode(ContainerNode):
             if child_height and child_height.mode != SizeValueMode.AUTO:
                 continue
 
-            child._forced_size = (child._forced_size[0], self.content_height)
+            child._set_forced_size((child._forced_size[0], self.content_height))
 
     def _apply_fill_available_constraints(self):
         """
@@ -155,7 +121,7 @@ class RowNode(ContainerNode):
         space_per_flexible_child = max(0, remaining_space / len(flexible_children))
 
         for child in flexible_children:
-            child._forced_size = (space_per_flexible_child, child._forced_size[1])
+            child._set_forced_size((space_per_flexible_child, child._forced_size[1]))
 
     def _calculate_children_relative_positions(self, children: list[Node], get_child_bounds: Callable[[Node], skia.Rect]) -> list[Tuple[float, float]]:
         positions = []
@@ -1,7 +1,8 @@
 from typing import Optional
+from math import ceil, floor
 import skia
 from .node import Node
-from ..models import TextDecoration, Style, RenderProps, Line
+from ..models import TextDecoration, Style, RenderProps, Line, SizeValueMode
 from ..text import FontManager, TextShaper
 from ..painters import Painter, BackgroundPainter, TextPainter, DecorationPainter, BorderPainter
 from ..utils import clone_skia_rect, cached_property, cached_method
@@ -19,6 +20,21 @@ class TextNode(Node):
     def text(self) -> str:
         return self._text
 
+    def set_text(self, text: str) -> None:
+        """
+        Replaces the text of the node. It takes effect on the next render of this node tree.
+
+        Only trees that are rendered again benefit from the incremental relayout: `Canvas.render()` builds a new
+        node tree on every call, so this is only useful when the nodes are kept and rendered directly.
+        The layout is computed again from the closest container with absolute width and height
+        (or from the root, if there is none).
+        """
+        if text == self._text:
+            return
+        self._text = text
+        self.clear_cache('content')
+        self._mark_layout_dirty()
+
     @cached_property('bounds')
     def text_bounds(self) -> Optional[skia.Rect]:
         return self._compute_text_bounds()
@@ -29,12 +45,21 @@ class TextNode(Node):
             raise RuntimeError("Unexpected error: self._text_shaper is not defined, call _init_render_dependencies() first")
         return self._text_shaper.shape(self._text, self._get_text_wrap_width())
 
+    @cached_property('content')
+    def min_content_width(self) -> float:
+        """
+        The width of the longest unbreakable token of the text. It only depends on the text and the styles.
+        """
+        if not self._text_shaper:
+            raise RuntimeError("Unexpected error: self._text_shaper is not defined, call _init_render_dependencies() first")
+        return self._text_shaper.get_min_content_width(self._text)
+
     def _init_render_dependencies(self, render_props: RenderProps):
         super()._init_render_dependencies(render_props)
         if not self._render_props:
             raise RuntimeError("Unexpected error: self._render_props is not defined. Parent node should initialize this dependency.")
 
-        self._font_manager = FontManager(self.computed_styles, self._render_props.font_smoothing)
+        self._font_manager = FontManager.get_or_create(self.computed_styles, self._render_props.font_smoothing)
         self._text_shaper = TextShaper(self.computed_styles, self._font_manager)
 
     def clear(self):
@@ -43,12 +68,18 @@ class TextNode(Node):
         self._text_shaper = None
         self._text_wrap_width = None
 
+    def _reset_layout(self) -> None:
+        super()._reset_layout()
+        self._text_wrap_width = None
+
     def _get_painters(self) -> list[Painter]:
         if not self._font_manager or not self._render_props:
             raise RuntimeError("Unexpected error: self._font_manager or self._render_props are not defined, call _init_render_dependencies() first")
         
         return [
-            BackgroundPainter(self.computed_styles, self.border_bounds, self._render_props.is_svg),
+            BackgroundPainter(
+                self.computed_styles, self.border_bounds, self._render_props.is_svg, self._render_props.sample_images_from_source
+            ),
             BorderPainter(self.computed_styles, self.border_bounds),
             TextPainter(self.computed_styles, self._font_manager, self.text_bounds, self.content_bounds, self.shaped_lines, self._render_props.is_svg),
             DecorationPainter(self.computed_styles, self._font_manager, self.text_bounds, self.shaped_lines),
@@ -128,7 +159,7 @@ class TextNode(Node):
     
     def _set_width_constraint(self, width_constraint: Optional[int]) -> None:      
         if width_constraint is None:
-            self._text_wrap_width = None
+            self._set_text_wrap_width(None)
             return
         
         wrap_width = width_constraint
@@ -139,28 +170,55 @@ class TextNode(Node):
         horizontal_spacing = padding.left + padding.right + (border_width * 2) + margin.left + margin.right
         content_width = wrap_width - horizontal_spacing
         
-        self._text_wrap_width = max(0, content_width)
+        self._set_text_wrap_width(max(0, content_width))
+
+    def _set_text_wrap_width(self, text_wrap_width: Optional[int]) -> None:
+        if text_wrap_width == self._text_wrap_width:
+            return
+        self._text_wrap_width = text_wrap_width
+        self._invalidate_layout()
 
     def _get_text_wrap_width(self) -> Optional[int]:
+        if not self._can_wrap():
+            return None
+
+        if self._forced_size[0] is not None:
+            return self._forced_size[0]
+        
+        return self._text_wrap_width
+
+    def _can_wrap(self) -> bool:
         text_wrap_style = self.computed_styles.text_wrap.get()
         if text_wrap_style.value == 'nowrap':
-            return None
+            return False
         
         # If element has positioning, disable text wrapping
         position_style = self.computed_styles.position.get()
         if position_style is not None:
-            return None
-    
-        if self._forced_size[0] is not None:
-            return self._forced_size[0]
-        
-        return self._text_wrap_width
+            return False
+
+        return True
     
     def compute_min_width(self) -> int:
-        original_text_wrap_width = self._text_wrap_width
-        self._clear_bounds()
-        self._text_wrap_width = 1
-        min_width = self.margin_bounds.width()
-        self._clear_bounds()
-        self._text_wrap_width = original_text_wrap_width
-        return min_width
+        if not self._is_width_wrappable():
+            return self.margin_bounds.width()
+
+        # Wrapped to the narrowest width, each line would have a single word.
+        #  The boxes are snapped to integer coordinates like the bounds (see to_int_skia_rect())
+        padding = self.computed_styles.padding.get()
+        margin = self.computed_styles.margin.get()
+        border = self.computed_styles.border.get()
+        border_width = border.width if border else 0
+        left, right = 0, ceil(self.min_content_width)
+        for left_spacing, right_spacing in ((padding.left, padding.right), (border_width, border_width), (margin.left, margin.right)):
+            left, right = floor(left - left_spacing), ceil(right + right_spacing)
+        return right - left
+
+    def _is_width_wrappable(self) -> bool:
+        """
+        Returns whether the width of the node depends on the text wrap width.
+        """
+        width = self.computed_styles.width.get()
+        if width and width.mode not in (SizeValueMode.AUTO, SizeValueMode.FIT_CONTENT, SizeValueMode.FILL_AVAILABLE):
+            return False
+        return self._can_wrap() and self._forced_size[0] is None
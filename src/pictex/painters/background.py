@@ -1,14 +1,16 @@
+from math import ceil
 import skia
 from .painter import Painter
-from ..utils import create_composite_shadow_filter
+from ..utils import create_composite_shadow_filter, create_image_effects_filter, get_resized_image, get_downscaled_image
 from ..models import Style, BackgroundImageSizeMode
 
 class BackgroundPainter(Painter):
 
-    def __init__(self, style: Style, box_bounds: skia.Rect, is_svg: bool):
+    def __init__(self, style: Style, box_bounds: skia.Rect, is_svg: bool, sample_from_source: bool = False):
         super().__init__(style)
         self._box_bounds = box_bounds
         self._is_svg = is_svg
+        self._sample_from_source = sample_from_source
 
     def paint(self, canvas: skia.Canvas) -> None:
         rounded_box_rect = self._build_rounded_box_rect()
@@ -62,110 +64,9 @@ class BackgroundPainter(Painter):
 
         paint = skia.Paint(AntiAlias=True)
         
-        # Apply Image Effects
-        effects = self._style.image_effects.get()
-        if effects:
-            filters = []
-            
-            # Brightness (scale)
-            # JS brightness(150%) -> 1.5 multiplier
-            if effects.brightness != 100:
-                b = effects.brightness / 100.0
-                matrix = [
-                    b, 0, 0, 0, 0,
-                    0, b, 0, 0, 0,
-                    0, 0, b, 0, 0,
-                    0, 0, 0, 1, 0
-                ]
-                filters.append(skia.ColorFilters.Matrix(matrix))
-
-            # Contrast
-            # v' = (v - 0.5) * c + 0.5
-            if effects.contrast != 100:
-                c = effects.contrast / 100.0
-                t = (1.0 - c) / 2.0
-                matrix = [
-                    c, 0, 0, 0, t,
-                    0, c, 0, 0, t,
-                    0, 0, c, 0, t,
-                    0, 0, 0, 1, 0
-                ]
-                filters.append(skia.ColorFilters.Matrix(matrix))
-
-            # Saturation
-            if effects.saturation != 100:
-                s = effects.saturation / 100.0
-                # Skia has MakeLumaColorFilter? No, ColorMatrix usually.
-                # Standard RGB to Luminance constants: 0.2126, 0.7152, 0.0722
-                # sat matrix:
-                # [ r + (1-r)*s,  g*(1-s),    b*(1-s),    0, 0 ]
-                # [ r*(1-s),      g + (1-g)*s,b*(1-s),    0, 0 ]
-                # etc.
-                # Actually skia module usually exposes skia.ColorMatrix or similar?
-                # skia-python binding check: skia.ColorFilters.Matrix(list)
-                
-                # Simplified Saturation Matrix generator
-                rw, gw, bw = 0.2126, 0.7152, 0.0722
-                invS = 1.0 - s
-                R = invS * rw
-                G = invS * gw
-                B = invS * bw
-                
-                matrix = [
-                    R + s, G,     B,     0, 0,
-                    R,     G + s, B,     0, 0,
-                    R,     G,     B + s, 0, 0,
-                    0,     0,     0,     1, 0
-                ]
-                filters.append(skia.ColorFilters.Matrix(matrix))
-                
-            # Warmth (Sepia)
-            if effects.warmth > 0:
-                # Sepia is usually a specific matrix. 
-                # Can blend between normal and sepia based on percentage.
-                amount = effects.warmth / 100.0
-                invAmount = 1.0 - amount
-                
-                # Standard Sepia Matrix
-                # R = 0.393 + 0.769 + 0.189
-                # But we valid mix with identity.
-                # Identity:
-                # 1 0 0 0 0
-                # 0 1 0 0 0
-                # ...
-                
-                # Sepia:
-                # 0.393 0.769 0.189 0 0 
-                # 0.349 0.686 0.168 0 0
-                # 0.272 0.534 0.131 0 0
-                
-                matrix = [
-                    0.393*amount + 1*invAmount, 0.769*amount, 0.189*amount, 0, 0,
-                    0.349*amount, 0.686*amount + 1*invAmount, 0.168*amount, 0, 0,
-                    0.272*amount, 0.534*amount, 0.131*amount + 1*invAmount, 0, 0,
-                    0, 0, 0, 1, 0
-                ]
-                filters.append(skia.ColorFilters.Matrix(matrix))
-
-            # Compose Filters
-            if filters:
-                # Compose from last to first (outer to inner)?
-                # Skia compose(outer, inner).
-                # If we apply brightness then contrast, it means contrast(brightness(pixel)).
-                # So brightness is inner.
-                # Order in list: brightness, contrast, saturation, warmth.
-                # We iterate and compose.
-                # F = filters[0]
-                # F = input -> brightness -> output
-                # Next is contrast. input -> contrast -> output.
-                # We want input -> brightness -> contrast -> ...
-                # So combined = compose(contrast, brightness)
-                
-                final_filter = filters[0]
-                for f in filters[1:]:
-                    final_filter = skia.ColorFilters.Compose(f, final_filter)
-                    
-                paint.setColorFilter(final_filter)
+        color_filter = create_image_effects_filter(self._style.image_effects.get())
+        if color_filter:
+            paint.setColorFilter(color_filter)
 
         if background_image_info.size_mode == BackgroundImageSizeMode.TILE:
             shader = original_image.makeShader(
@@ -184,27 +85,60 @@ class BackgroundPainter(Painter):
             box_rect=self._box_bounds,
             mode=background_image_info.size_mode
         )
+        if not self._is_svg:
+            # SVG output embeds the original image
+            original_image, src_rect = self._downscale_for_destination(canvas, original_image, src_rect, dst_rect)
+
+        if self._sample_from_source:
+            # The source region is sampled straight into the destination, no intermediate bitmap is created
+            canvas.drawImageRect(
+                original_image, src_rect, dst_rect, sampling_options, paint, skia.Canvas.kStrict_SrcRectConstraint
+            )
+            canvas.restore()
+            return
 
-        image_to_resize = original_image.makeSubset(src_rect.roundOut())
-        resized_image = image_to_resize.resize(
+        resized_image = get_resized_image(
+            original_image,
+            src_rect.roundOut(),
             width=int(dst_rect.width()),
             height=int(dst_rect.height()),
-            options=sampling_options
+            sampling=sampling_options
         )
 
-        if not resized_image:
-            return
-
-        canvas.drawImage(
-            resized_image,
-            dst_rect.left(),
-            dst_rect.top(),
-            sampling_options,
-            paint
-        )
+        if resized_image:
+            canvas.drawImage(
+                resized_image,
+                dst_rect.left(),
+                dst_rect.top(),
+                sampling_options,
+                paint
+            )
 
         canvas.restore()
 
+    def _downscale_for_destination(
+            self, canvas: skia.Canvas, image: skia.Image, src_rect: skia.Rect, dst_rect: skia.Rect) -> tuple[skia.Image, skia.Rect]:
+        """
+        Returns the image decoded at the smallest scale that still covers the destination (in device pixels),
+        and the source rect mapped to it. Large images drawn in small boxes (e.g. avatars) aren't decoded at full size.
+        """
+        device_scale = canvas.getTotalMatrix().getMaxScale()
+        if device_scale <= 0:
+            # Perspective transforms have no single scale
+            return image, src_rect
+
+        scale = max(dst_rect.width() / src_rect.width(), dst_rect.height() / src_rect.height()) * device_scale
+        downscaled_image = get_downscaled_image(image, ceil(image.width() * scale), ceil(image.height() * scale))
+        if downscaled_image is image:
+            return image, src_rect
+
+        scale_x = downscaled_image.width() / image.width()
+        scale_y = downscaled_image.height() / image.height()
+        downscaled_src_rect = skia.Rect.MakeLTRB(
+            src_rect.left() * scale_x, src_rect.top() * scale_y, src_rect.right() * scale_x, src_rect.bottom() * scale_y
+        )
+        return downscaled_image, downscaled_src_rect
+
     def _calculate_cover_contain_rects(
             self, image_width: float, image_height: float, box_rect: skia.Rect, mode: BackgroundImageSizeMode):
 
@@ -10,9 +10,16 @@ from ..nodes import Node
 
 class Renderer:
 
-    def render_as_bitmap(self, root: Node, crop_mode: CropMode, font_smoothing: FontSmoothing, scale_factor: float = 1.0) -> BitmapImage:
+    def render_as_bitmap(
+            self,
+            root: Node,
+            crop_mode: CropMode,
+            font_smoothing: FontSmoothing,
+            scale_factor: float = 1.0,
+            sample_images_from_source: bool = True,
+    ) -> BitmapImage:
         """Renders the nodes with the given builders, generating a bitmap image."""
-        root.prepare_tree_for_rendering(RenderProps(False, crop_mode, font_smoothing))
+        root.prepare_tree_for_rendering(RenderProps(False, crop_mode, font_smoothing, sample_images_from_source))
 
         canvas_bounds = root.paint_bounds
         render_width = int(canvas_bounds.width() * scale_factor)
@@ -37,7 +44,7 @@ class Renderer:
     def render_as_svg(self, root: Node, embed_fonts: bool) -> VectorImage:
         """Renders the text with the given builders, generating a vector image."""
         # If support shadows in the near future, we should use CropMode.NONE.
-        root.prepare_tree_for_rendering(RenderProps(True, CropMode.CONTENT_BOX, FontSmoothing.SUBPIXEL))
+        root.prepare_tree_for_rendering(RenderProps(True, CropMode.CONTENT_BOX, FontSmoothing.SUBPIXEL, sample_images_from_source=False))
 
         canvas_bounds = root.paint_bounds
         stream = skia.DynamicMemoryWStream()
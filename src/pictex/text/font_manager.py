@@ -1,7 +1,7 @@
 import skia
 import os
 import struct
-from typing import List, Optional
+from typing import List, Optional, Hashable
 import warnings
 from ..models import Style, FontStyle, FontSmoothing
 from ..exceptions import FontNotFoundWarning
@@ -9,14 +9,69 @@ from .typeface_loader import TypefaceLoader
 from .. import utils
 
 class FontManager:
+    # Managers only depend on the font properties of the style, so they are shared by nodes and renders
+    _pool: utils.LRUCache[Hashable, "FontManager"] = utils.LRUCache(max_size=256)
 
     def __init__(self, style: Style, font_smoothing: FontSmoothing):
         self._style = style
         self._font_smoothing = font_smoothing
         self._font_heights: dict[str, float] = {}
+        # Warnings of the fonts that weren't found, emitted again each time a pooled manager is reused
+        self._font_warnings: list[FontNotFoundWarning] = []
         self._fallback_font_typefaces = self._prepare_fallbacks()
         self._primary_font = self._create_primary_font()
 
+    @staticmethod
+    def get_or_create(style: Style, font_smoothing: FontSmoothing) -> "FontManager":
+        """
+        Returns a shared manager for the font properties of the style
+        (family, fallbacks, size, weight and style) and the font smoothing.
+        Font files are identified by their modification time too, so a replaced file gets a new manager.
+        The fonts are created once, and font heights are measured once for all the nodes using them.
+        """
+        key = (
+            FontManager._get_font_source_key(style.font_family.get()),
+            tuple(FontManager._get_font_source_key(fallback) for fallback in style.font_fallbacks.get()),
+            style.font_size.get(),
+            style.font_weight.get(),
+            style.font_style.get(),
+            font_smoothing,
+        )
+        created: list["FontManager"] = []
+        def create() -> "FontManager":
+            created.append(FontManager(style, font_smoothing))
+            return created[0]
+
+        manager = FontManager._pool.get_or_create(key, create)
+        if not created:
+            manager._warn_fonts_not_found()
+        return manager
+
+    @staticmethod
+    def get_pool() -> utils.LRUCache[Hashable, "FontManager"]:
+        """
+        Returns the process-wide pool of font managers.
+        It can be used to inspect its hits/misses or to change its size limit (`max_size`, 0 disables it).
+        """
+        return FontManager._pool
+
+    @staticmethod
+    def clear_cache() -> None:
+        FontManager._pool.clear()
+
+    @staticmethod
+    def _get_font_source_key(font_path_or_name: Optional[str]) -> Hashable:
+        try:
+            # Same as TypefaceLoader, an updated font file is loaded again
+            modification_time: Optional[float] = os.path.getmtime(font_path_or_name) if font_path_or_name else None
+        except OSError:
+            modification_time = None
+        return font_path_or_name, modification_time
+
+    def _warn_fonts_not_found(self) -> None:
+        for warning in self._font_warnings:
+            warnings.warn(warning)
+
     def get_primary_font(self) -> skia.Font:
         return self._primary_font
 
@@ -87,7 +142,8 @@ class FontManager:
         actual_font_family = typeface.getFamilyName()
         if actual_font_family.lower() != font_family.lower():
             warning_message = f"Font '{font_family}' was not found. It will be ignored."
-            warnings.warn(FontNotFoundWarning(warning_message))
+            self._font_warnings.append(FontNotFoundWarning(warning_message))
+            warnings.warn(self._font_warnings[-1])
             return None
         
         return typeface
@@ -100,20 +156,16 @@ class FontManager:
         }
         to_four_char_code = lambda tag: struct.unpack('!I', tag.encode('utf-8'))[0]
         available_axes_tags = { axis.tag for axis in typeface.getVariationDesignParameters() }
-        coordinates_list = [
-            skia.FontArguments.VariationPosition.Coordinate(axis=to_four_char_code(tag), value=value)
+        coordinates = tuple(
+            (to_four_char_code(tag), value)
             for tag, value in variations.items()
             if to_four_char_code(tag) in available_axes_tags
-        ]
+        )
 
-        if not coordinates_list:
+        if not coordinates:
             return typeface
-        
-        coordinates = skia.FontArguments.VariationPosition.Coordinates(coordinates_list)
-        variation_position = skia.FontArguments.VariationPosition(coordinates)
-        font_args = skia.FontArguments()
-        font_args.setVariationDesignPosition(variation_position)
-        return TypefaceLoader.clone_with_arguments(typeface, font_args)
+
+        return TypefaceLoader.clone_with_variations(typeface, coordinates)
 
     def _prepare_fallbacks(self) -> List[skia.Font]:
         user_fallbacks = [self._create_font_typeface(fb) for fb in self._style.font_fallbacks.get()]
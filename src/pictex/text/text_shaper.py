@@ -1,45 +1,112 @@
 import skia
-from typing import List, Optional
+from typing import List, Optional, Hashable
 from .typeface_loader import TypefaceLoader
 from .font_manager import FontManager
 from ..models import Style, Line, TextRun
 from .. import utils
 import re
 import regex
+import numpy as np
+
+# A (start, end, font) range of a line text that can be rendered with a single font
+RunSpan = tuple[int, int, skia.Font]
+# The (start, end) range and the width of each word/space token of a line
+MeasuredTokens = tuple[list[tuple[int, int]], list[float]]
 
 class TextShaper:
+    # Shaped lines are shared between nodes and renders, so they must be treated as read-only
+    _shaping_cache: utils.LRUCache[Hashable, List[Line]] = utils.LRUCache(max_size=1024)
+    # Run spans and word wrapping measurements, by (line, fonts)
+    _line_spans_cache: utils.LRUCache[Hashable, list[RunSpan]] = utils.LRUCache(max_size=1024)
+    _line_tokens_cache: utils.LRUCache[Hashable, MeasuredTokens] = utils.LRUCache(max_size=1024)
+
     def __init__(self, style: Style, font_manager: FontManager):
         self._style = style
         self._font_manager = font_manager
 
+    @staticmethod
+    def get_shaping_cache() -> utils.LRUCache[Hashable, List[Line]]:
+        """
+        Returns the process-wide cache of shaped lines.
+        It can be used to inspect its hits/misses or to change its size limit (`max_size`, 0 disables it).
+        """
+        return TextShaper._shaping_cache
+
+    @staticmethod
+    def clear_cache() -> None:
+        TextShaper._shaping_cache.clear()
+        TextShaper._line_spans_cache.clear()
+        TextShaper._line_tokens_cache.clear()
+
     def shape(self, text: str, max_width: Optional[float] = None) -> List[Line]:
         """
         Breaks a text string into lines and runs, applying font fallbacks.
         This is the core of the text shaping and fallback logic.
         If max_width is provided, performs word wrapping.
+        Results are cached, so shaping the same text with the same fonts and width is done only once.
         """
+        cache_key = (text, max_width, self._get_fonts_key())
+        lines = TextShaper._shaping_cache.get_or_create(cache_key, lambda: self._shape(text, max_width))
+        return list(lines)
+
+    def get_min_content_width(self, text: str) -> float:
+        """
+        Returns the min-content width of the text: the advance of its longest unbreakable token.
+        It uses the measured tokens of word wrapping, so the text doesn't need to be shaped.
+        """
+        min_content_width = 0.0
+        for line_text in text.split('\n'):
+            if not line_text:
+                continue
 
+            tokens, token_widths = self._measure_tokens(line_text, self._get_line_spans(line_text))
+            for (start, _), token_width in zip(tokens, token_widths):
+                # Spaces are removed at line breaks, unless the line has a single token (so it's never wrapped)
+                if len(tokens) == 1 or not line_text[start].isspace():
+                    min_content_width = max(min_content_width, token_width)
+
+        return min_content_width
+
+    def _get_fonts_key(self) -> Hashable:
+        fallback_typefaces = self._font_manager.get_fallback_font_typefaces()
+        return (
+            self._get_font_key(self._font_manager.get_primary_font()),
+            tuple(typeface.uniqueID() for typeface in fallback_typefaces),
+            # Weight and style are used to find system fonts for unsupported graphemes
+            int(self._style.font_weight.get()),
+            self._style.font_style.get(),
+        )
+
+    def _get_font_key(self, font: skia.Font) -> Hashable:
+        return (
+            font.getTypeface().uniqueID(),
+            font.getSize(),
+            font.getEdging(),
+            font.isSubpixel(),
+        )
+
+    def _shape(self, text: str, max_width: Optional[float]) -> List[Line]:
         shaped_lines: list[Line] = []
-        
+
         for line_text in text.split('\n'):
             if not line_text:
                 shaped_lines.append(self._create_empty_line())
                 continue
-            
+
+            # Fallbacks are resolved once for the whole line, and wrapped lines are sliced from its runs
+            spans = self._get_line_spans(line_text)
+            line_ranges = [(0, len(line_text))]
             if max_width is not None:
-                wrapped_lines = self._wrap_line_to_width(line_text, max_width)
-                for wrapped_line_text in wrapped_lines:
-                    if not wrapped_line_text:
-                        shaped_lines.append(self._create_empty_line())
-                        continue
-                    wrapped_runs: list[TextRun] = self._split_line_in_runs(wrapped_line_text)
-                    line = self._create_line(wrapped_runs)
-                    shaped_lines.append(line)
-            else:
-                runs: list[TextRun] = self._split_line_in_runs(line_text)
-                line = self._create_line(runs)
-                shaped_lines.append(line)
-        
+                tokens, token_widths = self._measure_tokens(line_text, spans)
+                line_ranges = self._wrap_line_to_width(line_text, tokens, token_widths, max_width)
+
+            for start, end in line_ranges:
+                if start == end:
+                    shaped_lines.append(self._create_empty_line())
+                    continue
+                runs = self._slice_runs(line_text, spans, start, end)
+                shaped_lines.append(self._create_line(runs))
+
         return shaped_lines
 
     def _create_empty_line(self) -> Line:
@@ -50,49 +117,113 @@ class TextShaper:
         font_metrics = primary_font.getMetrics()
         line.bounds = skia.Rect.MakeLTRB(0, font_metrics.fAscent, 0, font_metrics.fDescent)
         return line
-    
+
     def _create_line(self, runs: list[TextRun]) -> Line:
         line_width: float = 0
         font_height: float = 0
         for run in runs:
             run.blob = skia.TextBlob.MakeFromShapedText(run.text, run.font)
             # TODO: it's failing with the emoji '👨‍👩‍👧‍👦' in the system font from windows for emojis
-            glyph_ids = [gid for run in list(run.blob) for gid in run.fGlyphIndices]
-            run.width = sum(run.font.getWidths(glyph_ids))
+            run.width = utils.get_text_blob_width(run.blob, run.font)
             line_width += run.width
             font_height = max(font_height, self._font_manager.get_font_height(run.font))
 
         return Line(runs=runs, width=line_width, height=font_height, bounds=skia.Rect.MakeWH(line_width, font_height))
-    
-    def _split_line_in_runs(self, line_text: str) -> list[TextRun]:
+
+    def _get_line_spans(self, line_text: str) -> list[RunSpan]:
+        return TextShaper._line_spans_cache.get_or_create(
+            (line_text, self._get_fonts_key()),
+            lambda: self._split_line_in_spans(line_text)
+        )
+
+    def _measure_tokens(self, line_text: str, spans: list[RunSpan]) -> MeasuredTokens:
+        """
+        Splits the line in words and spaces (keeping both) and measures them,
+        shaping each token with the fonts that actually render its characters (fallback fonts included).
+        Tokens are measured like rendered runs (the advances of their shaped glyphs), so ligatures and clusters
+        (combining marks, ZWJ sequences) wrap at their rendered width. Repeated tokens are shaped once per font.
+        The result is cached, so re-wrapping a line at a different width doesn't need any Skia call.
+        """
+        def measure() -> MeasuredTokens:
+            tokens = [match.span() for match in re.finditer(r'\S+|\s+', line_text)]
+            token_widths: list[float] = []
+            # Widths by (text, typeface), all the fonts of a line have the same size and settings
+            shaped_widths: dict[tuple[str, int], float] = {}
+            span_index = 0
+            for token_start, token_end in tokens:
+                token_width = 0.0
+                # A token is split in several pieces when it's rendered with several fonts
+                while span_index < len(spans) and spans[span_index][1] <= token_start:
+                    span_index += 1
+                index = span_index
+                while index < len(spans) and spans[index][0] < token_end:
+                    span_start, span_end, font = spans[index]
+                    piece = line_text[max(span_start, token_start):min(span_end, token_end)]
+                    key = (piece, font.getTypeface().uniqueID())
+                    width = shaped_widths.get(key)
+                    if width is None:
+                        width = shaped_widths[key] = self._get_shaped_width(piece, font)
+                    token_width += width
+                    index += 1
+                token_widths.append(token_width)
+            return tokens, token_widths
+
+        return TextShaper._line_tokens_cache.get_or_create((line_text, self._get_fonts_key()), measure)
+
+    def _get_shaped_width(self, text: str, font: skia.Font) -> float:
+        blob = skia.TextBlob.MakeFromShapedText(text, font)
+        return utils.get_text_blob_width(blob, font) if blob else 0.0
+
+    def _slice_runs(self, line_text: str, spans: list[RunSpan], start: int, end: int) -> list[TextRun]:
+        return [
+            TextRun(line_text[max(span_start, start):min(span_end, end)], font)
+            for span_start, span_end, font in spans
+            if span_start < end and span_end > start
+        ]
+
+    def _split_line_in_spans(self, line_text: str) -> list[RunSpan]:
+        """
+        Splits the line in (start, end, font) spans, where each span can be rendered with a single font.
+        The spans are computed in a single pass over the line.
+        """
         primary_font = self._font_manager.get_primary_font()
-        line_runs: list[TextRun] = []
-        current_run_text = ""
+        if not line_text:
+            return []
 
-        for grapheme in regex.findall(r"\X", line_text):
-            if utils.is_grapheme_supported_for_typeface(grapheme, primary_font.getTypeface()):
-                current_run_text += grapheme
-                continue
+        # The whole line is checked against the primary font at once,
+        #  so only the graphemes that are not supported need to be visited
+        supported_codepoints = utils.get_supported_codepoints_mask(utils.to_codepoints(line_text), primary_font.getTypeface())
+        if supported_codepoints.all():
+            # Most lines are fully supported, they don't need to be split in graphemes
+            return [(0, len(line_text), primary_font)]
+
+        graphemes: list[str] = regex.findall(r"\X", line_text)
+        grapheme_lengths = np.fromiter(map(len, graphemes), dtype=np.intp, count=len(graphemes))
+        grapheme_starts = np.concatenate(([0], np.cumsum(grapheme_lengths)[:-1]))
+        supported_graphemes = np.logical_and.reduceat(supported_codepoints, grapheme_starts)
 
-            if current_run_text:
-                run = TextRun(current_run_text, primary_font)
-                line_runs.append(run)
-                current_run_text = ""
+        spans: list[RunSpan] = []
+        current_run_start = 0
+        for index in np.flatnonzero(~supported_graphemes).tolist():
+            grapheme_start = int(grapheme_starts[index])
+            grapheme_end = grapheme_start + int(grapheme_lengths[index])
+            if grapheme_start > current_run_start:
+                spans.append((current_run_start, grapheme_start, primary_font))
+            current_run_start = grapheme_end
 
-            fallback_font = self._get_fallback_font_for_glyph(grapheme, primary_font)
-            is_same_font_than_last_run = len(line_runs) > 0 and line_runs[-1].font.getTypeface() == fallback_font.getTypeface()
+            fallback_font = self._get_fallback_font_for_glyph(graphemes[index], primary_font)
+            is_same_font_than_last_run = len(spans) > 0 and spans[-1][2].getTypeface() == fallback_font.getTypeface()
             if is_same_font_than_last_run:
                 # we join contiguous runs with same font
-                line_runs[-1] = TextRun(line_runs[-1].text + grapheme, fallback_font)
+                spans[-1] = (spans[-1][0], grapheme_end, fallback_font)
             else:
-                line_runs.append(TextRun(grapheme, fallback_font))
-        
+                spans.append((grapheme_start, grapheme_end, fallback_font))
+
         # Add the last run
-        if current_run_text:
-            run = TextRun(current_run_text, primary_font)
-            line_runs.append(run)
-        
-        return line_runs
+        if current_run_start < len(line_text):
+            spans.append((current_run_start, len(line_text), primary_font))
+
+        return spans
 
     def _get_fallback_font_for_glyph(self, grapheme: str, primary_font: skia.Font) -> skia.Font:
         fallback_typefaces = self._font_manager.get_fallback_font_typefaces()
@@ -117,54 +248,50 @@ class TextShaper:
         # if we don't find any font in the system supporting the glyph, we just use the primary font
         return primary_font
 
-    def _wrap_line_to_width(self, text: str, max_width: float) -> List[str]:
+    def _wrap_line_to_width(
+            self,
+            text: str,
+            tokens: list[tuple[int, int]],
+            token_widths: list[float],
+            max_width: float
+    ) -> list[tuple[int, int]]:
         """
-        Wraps a single line of text to fit within the specified width.
+        Wraps a single line of text to fit within the specified width, returning the (start, end) range of each line.
         Words are treated as indivisible units.
+        It's a pure arithmetic pass over the measured token widths.
         """
-        # Split into words and spaces, keeping both
-        tokens: list[str] = re.findall(r'\S+|\s+', text)
         if not tokens:
-            return ['']
+            return [(0, 0)]
 
-        primary_font = self._font_manager.get_primary_font()
-        wrapped_lines: List[str] = []
-        current_line_tokens: list[str] = []
-        current_width = 0
-
-        for token in tokens:
-            # This is an approximate width measurement, since it is using the primary font
-            # some characters may be rendered with a fallback font, leading to a different final width
-            token_width = primary_font.measureText(token)
-
-            # If it's the first token, add it regardless
-            if not current_line_tokens:
-                current_line_tokens.append(token)
-                current_width = token_width
-                continue
+        wrapped_lines: list[tuple[int, int]] = []
+        line_start, line_end = tokens[0]
+        current_width = token_widths[0]
 
+        for (token_start, token_end), token_width in zip(tokens[1:], token_widths[1:]):
             potential_width = current_width + token_width
 
             if potential_width <= max_width:
                 # Token fits, add it
-                current_line_tokens.append(token)
+                line_end = token_end
                 current_width = potential_width
             else:
                 # Token doesn't fit, start new line
-                wrapped_lines.append(''.join(current_line_tokens).strip())
-                current_line_tokens = [token]
+                wrapped_lines.append(self._strip_range(text, line_start, line_end))
+                line_start, line_end = token_start, token_end
                 current_width = token_width
 
-        if current_line_tokens:
-            wrapped_lines.append(''.join(current_line_tokens).strip())
-
-        if len(wrapped_lines) == 1:
+        if not wrapped_lines:
             # This is to avoid removing spaces at the begining or at the end of a line
             # when the line was not actually wrapped.
             # When the line is wrapped we must remove spaces at the begining and at the end of each line
             # to obtain an useful behavior (avoid single spaces at the begining of a line, for example)
-            return [text]
-        
-        return wrapped_lines if wrapped_lines else ['']
-    
-    
\ No newline at end of file
+            return [(0, len(text))]
+
+        wrapped_lines.append(self._strip_range(text, line_start, line_end))
+        return wrapped_lines
+
+    def _strip_range(self, text: str, start: int, end: int) -> tuple[int, int]:
+        line = text[start:end]
+        stripped_start = start + len(line) - len(line.lstrip())
+        stripped_end = end - (len(line) - len(line.rstrip()))
+        return stripped_start, max(stripped_start, stripped_end)
@@ -1,19 +1,40 @@
-from typing import Optional
+from typing import Optional, Hashable, Callable
 from ..models import TypefaceLoadingInfo, TypefaceSource
 from .. import utils
 import skia
+import os
+
+VariationCoordinates = tuple[tuple[int, float], ...]
 
 class TypefaceLoader:
-    _typefaces_loading_info: list[TypefaceLoadingInfo] = []
+    # Indexed by typeface unique ID. Typefaces are created once per source and kept in `_typeface_cache`,
+    # so it only grows with the fonts that are used. Entries aren't evicted: fonts of pooled managers and shaped lines
+    # can outlive the typeface cache entry, and they still need their loading info for clones and SVG export
+    _typefaces_loading_info: dict[int, TypefaceLoadingInfo] = {}
     _font_manager: skia.FontMgr = None
+    _typeface_cache: utils.LRUCache[Hashable, Optional[skia.Typeface]] = utils.LRUCache(max_size=64)
+    # System fallbacks by (grapheme, font style). None is cached too, for graphemes that no system font supports
+    _grapheme_fallback_cache: utils.LRUCache[Hashable, Optional[skia.Typeface]] = utils.LRUCache(max_size=1024)
 
     @staticmethod
     def load_default() -> skia.Typeface:
-        return TypefaceLoader._save(skia.Typeface(""), TypefaceSource.SYSTEM)
+        return TypefaceLoader._load_cached(
+            ("default",),
+            lambda: TypefaceLoader._save(skia.Typeface(""), TypefaceSource.SYSTEM)
+        )
 
     @staticmethod
     def load_from_file(filepath: str) -> Optional[skia.Typeface]:
-        return TypefaceLoader._save(skia.Typeface.MakeFromFile(filepath), TypefaceSource.FILE, filepath)
+        try:
+            # The modification time is part of the key, so an updated file is loaded again
+            modification_time: Optional[float] = os.path.getmtime(filepath)
+        except OSError:
+            modification_time = None
+
+        return TypefaceLoader._load_cached(
+            ("file", os.path.abspath(filepath), modification_time),
+            lambda: TypefaceLoader._save(skia.Typeface.MakeFromFile(filepath), TypefaceSource.FILE, filepath)
+        )
 
     @staticmethod
     def load_system_font(family: str, style: skia.FontStyle = None) -> skia.Typeface:
@@ -22,10 +43,62 @@ class TypefaceLoader:
             matches the requested familyName and fontStyle.
             Will never return null.
         """
-        return TypefaceLoader._save(skia.Typeface(family, style), TypefaceSource.SYSTEM)
+        return TypefaceLoader._load_cached(
+            ("system", family, TypefaceLoader._get_style_key(style)),
+            lambda: TypefaceLoader._save(skia.Typeface(family, style), TypefaceSource.SYSTEM)
+        )
 
     @staticmethod
     def load_for_grapheme(grapheme: str, style: skia.FontStyle) -> Optional[skia.Typeface]:
+        return TypefaceLoader._grapheme_fallback_cache.get_or_create(
+            (grapheme, TypefaceLoader._get_style_key(style)),
+            lambda: TypefaceLoader._match_system_font_for_grapheme(grapheme, style)
+        )
+
+    @staticmethod
+    def clone_with_variations(typeface: skia.Typeface, coordinates: VariationCoordinates) -> skia.Typeface:
+        """
+            Creates a clone of a loaded typeface using the received variation coordinates,
+            a sequence of (axis tag, value) pairs.
+        """
+        typeface_loading_info = TypefaceLoader.get_typeface_loading_info(typeface)
+        if not typeface_loading_info:
+            raise RuntimeError("Impossible to clone typeface: it was not loaded")
+
+        def clone() -> skia.Typeface:
+            # skia only keeps references to these objects, so each one must stay alive until makeClone()
+            coordinates_list = [
+                skia.FontArguments.VariationPosition.Coordinate(axis=axis, value=value)
+                for axis, value in coordinates
+            ]
+            skia_coordinates = skia.FontArguments.VariationPosition.Coordinates(coordinates_list)
+            variation_position = skia.FontArguments.VariationPosition(skia_coordinates)
+            font_args = skia.FontArguments()
+            font_args.setVariationDesignPosition(variation_position)
+            new_typeface = typeface.makeClone(font_args)
+            return TypefaceLoader._save(new_typeface, typeface_loading_info.source, typeface_loading_info.filepath)
+
+        return TypefaceLoader._load_cached(("clone", typeface.uniqueID(), coordinates), clone)
+
+    @staticmethod
+    def get_typeface_loading_info(typeface: skia.Typeface) -> Optional[TypefaceLoadingInfo]:
+        return TypefaceLoader._typefaces_loading_info.get(typeface.uniqueID())
+
+    @staticmethod
+    def get_typeface_cache() -> utils.LRUCache[Hashable, Optional[skia.Typeface]]:
+        """
+            Returns the process-wide typeface cache.
+            It can be used to inspect its hits/misses or to change its size limit (`max_size`).
+        """
+        return TypefaceLoader._typeface_cache
+
+    @staticmethod
+    def clear_cache() -> None:
+        TypefaceLoader._typeface_cache.clear()
+        TypefaceLoader._grapheme_fallback_cache.clear()
+
+    @staticmethod
+    def _match_system_font_for_grapheme(grapheme: str, style: skia.FontStyle) -> Optional[skia.Typeface]:
         for cp in grapheme:
             system_typeface = TypefaceLoader._get_font_manager().matchFamilyStyleCharacter(
                 "",
@@ -35,32 +108,23 @@ class TypefaceLoader:
             )
             if system_typeface and utils.is_grapheme_supported_for_typeface(grapheme, system_typeface):
                 return TypefaceLoader._save(system_typeface, TypefaceSource.SYSTEM)
-        
+
         return None
 
     @staticmethod
-    def clone_with_arguments(typeface: skia.Typeface, arguments: skia.FontArguments) -> skia.Typeface:
-        typeface_loading_info = TypefaceLoader.get_typeface_loading_info(typeface)
-        if not typeface_loading_info:
-            raise RuntimeError("Impossible to clone typeface: it was not loaded")
+    def _get_style_key(style: Optional[skia.FontStyle]) -> Optional[tuple[int, int, int]]:
+        return (style.weight(), style.width(), int(style.slant())) if style else None
 
-        new_typeface = typeface.makeClone(arguments)
-        typeface_loading_info.typeface = new_typeface
-        return new_typeface
-    
     @staticmethod
-    def get_typeface_loading_info(typeface: skia.Typeface) -> Optional[TypefaceLoadingInfo]:
-        for loading_info in TypefaceLoader._typefaces_loading_info:
-            if loading_info.typeface == typeface:
-                return loading_info
-        return None
+    def _load_cached(key: Hashable, load: Callable[[], Optional[skia.Typeface]]) -> Optional[skia.Typeface]:
+        return TypefaceLoader._typeface_cache.get_or_create(key, load)
 
     @staticmethod
     def _save(typeface: Optional[skia.Typeface], source: TypefaceSource, filepath: Optional[str] = None) -> Optional[skia.Typeface]:
         if not typeface:
             return None
-        
-        TypefaceLoader._typefaces_loading_info.append(TypefaceLoadingInfo(typeface, source, filepath))
+
+        TypefaceLoader._typefaces_loading_info[typeface.uniqueID()] = TypefaceLoadingInfo(typeface, source, filepath)
         return typeface
 
     @staticmethod
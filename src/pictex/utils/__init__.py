@@ -1,7 +1,13 @@
 from .alignment import get_line_x_position
-from .shadow import create_composite_shadow_filter
+from .shadow import create_composite_shadow_filter, get_shadow_filter_cache
+from .color_filter import create_image_effects_filter, get_image_effects_filter_cache
 from .cache import cached_method, cached_property, Cacheable
-from .font import is_variable_font, is_grapheme_supported_for_typeface
+from .lru_cache import LRUCache
+from .image_cache import load_image, get_resized_image, get_downscaled_image, get_image_cache
+from .font import (
+    is_variable_font, is_grapheme_supported_for_typeface, get_supported_codepoints_mask, to_codepoints,
+    get_text_blob_width
+)
 from .render_tree import create_render_tree
 
 
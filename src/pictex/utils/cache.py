@@ -1,26 +1,39 @@
 from functools import wraps
-from collections import defaultdict
-from typing import Optional
+from threading import Lock
+from typing import Any, Optional
+
+# Each cached property/method takes a fixed slot in the cache table of the instances,
+#  and each group has a generation counter: entries are valid only if they were stored in the current generation
+_slots_lock = Lock()
+_slot_count = 0
+_group_indexes: dict[str, int] = {}
+
+def _register_slot(group: str) -> tuple[int, int]:
+    global _slot_count
+    with _slots_lock:
+        slot = _slot_count
+        _slot_count += 1
+        group_index = _group_indexes.setdefault(group, len(_group_indexes))
+    return slot, group_index
 
 class _CachedPropertyDescriptor:
 
     def __init__(self, func, group):
         self._func = func
-        self._group = group
-        self._cache_attr_name = f"_cache_{func.__name__}"
+        self._slot, self._group_index = _register_slot(group)
         self.__doc__ = func.__doc__
 
     def __get__(self, instance, owner):
         if instance is None:
             return self
 
-        if hasattr(instance, self._cache_attr_name):
-            return getattr(instance, self._cache_attr_name)
+        generation = instance._get_cache_generation(self._group_index)
+        entry = instance._get_cache_entry(self._slot)
+        if entry is not None and entry[0] == generation:
+            return entry[1]
 
         value = self._func(instance)
-        setattr(instance, self._cache_attr_name, value)
-        instance._cache_registry[self._group].add(self._cache_attr_name)
-
+        instance._cache_entries[self._slot] = (generation, value)
         return value
 
 def cached_property(group: str = 'ungrouped'):
@@ -29,20 +42,19 @@ def cached_property(group: str = 'ungrouped'):
     return decorator
 
 def cached_method(group: str = 'ungrouped'):
-    
+
     def decorator(func):
-        cache_attr_name = f"_cache_{func.__name__}"
+        slot, group_index = _register_slot(group)
 
         @wraps(func)
         def wrapper(instance, *args, **kwargs):
-            if not hasattr(instance, cache_attr_name):
-                setattr(instance, cache_attr_name, {})
-
-                if not hasattr(instance, '_cache_registry'):
-                    instance._cache_registry = defaultdict(set)
-                instance._cache_registry[group].add(cache_attr_name)
+            generation = instance._get_cache_generation(group_index)
+            entry = instance._get_cache_entry(slot)
+            if entry is None or entry[0] != generation:
+                entry = (generation, {})
+                instance._cache_entries[slot] = entry
 
-            cache = getattr(instance, cache_attr_name)
+            cache = entry[1]
             key = (args, tuple(sorted(kwargs.items())))
 
             if key in cache:
@@ -53,21 +65,40 @@ def cached_method(group: str = 'ungrouped'):
             return result
 
         return wrapper
-    
+
     return decorator
 
 class Cacheable:
     def __init__(self) -> None:
-        self._cache_registry: defaultdict[str, set[str]] = defaultdict(set)
-    
+        self._cache_entries: list[Optional[tuple[int, Any]]] = [None] * _slot_count
+        self._cache_generations: list[int] = [0] * len(_group_indexes)
+
     def clear_cache(self, filter_by_group: Optional[str] = None) -> None:
-        items_to_remove = []
+        """
+        Invalidates the cached values, all of them or only the ones of a group.
+        Invalidating a group is O(1): its generation counter is increased, and the stored entries become stale.
+        """
         if filter_by_group is None:
-            items_to_remove = [key for cache_keys in self._cache_registry.values() for key in cache_keys]
-            self._cache_registry.clear()
-        elif filter_by_group in self._cache_registry:
-            items_to_remove = list(self._cache_registry[filter_by_group])
-            del self._cache_registry[filter_by_group]
-
-        for item in items_to_remove:
-            delattr(self, item)
+            self._cache_entries = [None] * _slot_count
+            return
+
+        group_index = _group_indexes.get(filter_by_group)
+        if group_index is not None:
+            self._get_cache_generation(group_index)
+            self._cache_generations[group_index] += 1
+
+    def _get_cache_generation(self, group_index: int) -> int:
+        try:
+            return self._cache_generations[group_index]
+        except IndexError:
+            # The group was registered after the instance was created
+            self._cache_generations.extend([0] * (len(_group_indexes) - len(self._cache_generations)))
+            return self._cache_generations[group_index]
+
+    def _get_cache_entry(self, slot: int) -> Optional[tuple[int, Any]]:
+        try:
+            return self._cache_entries[slot]
+        except IndexError:
+            # The slot was registered after the instance was created
+            self._cache_entries.extend([None] * (_slot_count - len(self._cache_entries)))
+            return None
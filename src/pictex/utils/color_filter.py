@@ -0,0 +1,95 @@
+import skia
+import numpy as np
+from typing import Optional
+from ..models import ImageEffects
+from .lru_cache import LRUCache
+
+# Standard RGB to luminance constants
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+_SEPIA = np.array([
+    [0.393, 0.769, 0.189],
+    [0.349, 0.686, 0.168],
+    [0.272, 0.534, 0.131],
+])
+
+# Color filters by effect values (brightness, contrast, saturation, warmth). Color filters are immutable, so they can be shared
+_image_effects_filter_cache: LRUCache[tuple[float, float, float, float], Optional[skia.ColorFilter]] = LRUCache(max_size=256)
+
+def get_image_effects_filter_cache() -> LRUCache[tuple[float, float, float, float], Optional[skia.ColorFilter]]:
+    """Returns the process-wide cache of image effects color filters."""
+    return _image_effects_filter_cache
+
+def create_image_effects_filter(effects: Optional[ImageEffects]) -> Optional[skia.ColorFilter]:
+    """
+    Creates the color filter of the image effects: brightness, then contrast, saturation and warmth (sepia).
+    Returns None if the effects don't change the colors.
+
+    The effect matrices are multiplied into a single 4x5 matrix, so the filter is evaluated once per pixel.
+    Skia clamps the colors after each matrix filter, so a matrix is only fused with the previous ones
+    when their output always stays in [0, 1] (for example, brightness over 100% doesn't).
+    """
+    if not effects:
+        return None
+
+    key = (effects.brightness, effects.contrast, effects.saturation, effects.warmth)
+    return _image_effects_filter_cache.get_or_create(key, lambda: _build_image_effects_filter(effects))
+
+def _build_image_effects_filter(effects: ImageEffects) -> Optional[skia.ColorFilter]:
+    stages: list[np.ndarray] = []
+    for matrix in _get_effect_matrices(effects):
+        if stages and _is_clamp_free(stages[-1]):
+            stages[-1] = matrix @ stages[-1]
+        else:
+            stages.append(matrix)
+
+    if not stages:
+        return None
+
+    color_filter = _to_color_filter(stages[0])
+    for stage in stages[1:]:
+        color_filter = skia.ColorFilters.Compose(_to_color_filter(stage), color_filter)
+    return color_filter
+
+def _get_effect_matrices(effects: ImageEffects) -> list[np.ndarray]:
+    """Returns the RGB affine matrices (3x4, in homogeneous 4x4 form) of the effects, in order of application."""
+    matrices = []
+    if effects.brightness != 100:
+        # JS brightness(150%) -> 1.5 multiplier
+        matrices.append(_make_affine(np.eye(3) * (effects.brightness / 100.0), 0.0))
+
+    if effects.contrast != 100:
+        # v' = (v - 0.5) * c + 0.5
+        c = effects.contrast / 100.0
+        matrices.append(_make_affine(np.eye(3) * c, (1.0 - c) / 2.0))
+
+    if effects.saturation != 100:
+        s = effects.saturation / 100.0
+        matrices.append(_make_affine(np.tile((1.0 - s) * _LUMINANCE_WEIGHTS, (3, 1)) + np.eye(3) * s, 0.0))
+
+    if effects.warmth > 0:
+        # Blend between the identity and the sepia matrix
+        amount = effects.warmth / 100.0
+        matrices.append(_make_affine(_SEPIA * amount + np.eye(3) * (1.0 - amount), 0.0))
+
+    return matrices
+
+def _make_affine(linear: np.ndarray, translation: float) -> np.ndarray:
+    matrix = np.eye(4)
+    matrix[:3, :3] = linear
+    matrix[:3, 3] = translation
+    return matrix
+
+def _is_clamp_free(matrix: np.ndarray) -> bool:
+    """Whether the matrix maps every color of the unit cube into the unit cube, so clamping its output is a no-op."""
+    linear, translation = matrix[:3, :3], matrix[:3, 3]
+    lowest = translation + np.minimum(linear, 0).sum(axis=1)
+    highest = translation + np.maximum(linear, 0).sum(axis=1)
+    return bool((lowest >= -1e-9).all() and (highest <= 1 + 1e-9).all())
+
+def _to_color_filter(matrix: np.ndarray) -> skia.ColorFilter:
+    # Skia matrices are 4x5 (RGBA rows, with the translation in the last column), alpha is kept
+    color_matrix = np.zeros((4, 5))
+    color_matrix[:3, :3] = matrix[:3, :3]
+    color_matrix[:3, 4] = matrix[:3, 3]
+    color_matrix[3, 3] = 1.0
+    return skia.ColorFilters.Matrix(color_matrix.ravel().tolist())
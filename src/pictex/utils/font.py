@@ -1,4 +1,11 @@
 import skia
+import numpy as np
+from .lru_cache import LRUCache
+
+# Coverage bitsets include the Basic and Supplementary Multilingual Planes (where emojis live).
+#  Codepoints above this limit are rare, so they are probed one by one.
+_COVERAGE_LIMIT = 0x20000
+_coverage_cache: LRUCache[int, np.ndarray] = LRUCache(max_size=64)
 
 def is_variable_font(typeface: skia.Typeface) -> bool:
     try:
@@ -7,4 +14,47 @@ def is_variable_font(typeface: skia.Typeface) -> bool:
         return False
 
 def is_grapheme_supported_for_typeface(grapheme: str, typeface: skia.Typeface) -> bool:
-    return all(typeface.unicharToGlyph(ord(cp)) != 0 for cp in grapheme)
+    return bool(get_supported_codepoints_mask(to_codepoints(grapheme), typeface).all())
+
+def to_codepoints(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+def get_supported_codepoints_mask(codepoints: np.ndarray, typeface: skia.Typeface) -> np.ndarray:
+    """
+    Returns a boolean array telling, for each codepoint, if the typeface has a glyph for it.
+    The check is done in a single vectorized pass over the typeface coverage bitset.
+    """
+    coverage = get_typeface_coverage(typeface)
+    in_coverage = codepoints < _COVERAGE_LIMIT
+    indexes = np.where(in_coverage, codepoints, 0)
+    supported = ((coverage[indexes >> 3] >> (indexes & 7)) & 1).astype(bool)
+
+    out_of_coverage = np.flatnonzero(~in_coverage)
+    for i in out_of_coverage:
+        supported[i] = typeface.unicharToGlyph(int(codepoints[i])) != 0
+
+    return supported
+
+def get_typeface_coverage(typeface: skia.Typeface) -> np.ndarray:
+    """
+    Returns a packed bitset (little bit order) with the codepoints supported by the typeface.
+    It's built once per typeface with a single batched glyph lookup, and cached.
+    """
+    def build_coverage() -> np.ndarray:
+        glyphs = np.asarray(typeface.unicharsToGlyphs(range(_COVERAGE_LIMIT)))
+        return np.packbits(glyphs != 0, bitorder="little")
+
+    return _coverage_cache.get_or_create(typeface.uniqueID(), build_coverage)
+
+def get_text_blob_width(blob: skia.TextBlob, font: skia.Font) -> float:
+    """
+    Returns the sum of the advances of the glyphs in the blob.
+    Each run is measured with the glyph IDs it already holds, without building a flattened list of glyphs.
+    Runs are read with `TextBlob.Iter`, since the Python iterator of the blob ends with a costly StopIteration.
+    """
+    total_width = 0.0
+    runs = skia.TextBlob.Iter(blob)
+    run = skia.TextBlob.Iter.Run()
+    while runs.next(run):
+        total_width += sum(font.getWidths(run.fGlyphIndices))
+    return total_width
@@ -0,0 +1,103 @@
+import base64
+import hashlib
+import os
+import numpy as np
+import skia
+from typing import Hashable, Optional
+from .lru_cache import LRUCache
+
+def _get_image_byte_size(image: Optional[skia.Image]) -> int:
+    return image.imageInfo().computeMinByteSize() if image is not None else 0
+
+# Decoded images by source, and their resized variants. Images are immutable, so they can be shared.
+# Encoded images are kept lazy (Skia decodes them once and keeps the pixels for the image), so SVG output still embeds
+# the original data. The cache is bounded by the bytes of the decoded pixels
+_image_cache: LRUCache[Hashable, Optional[skia.Image]] = LRUCache(
+    max_size=1024, max_weight=256 * 1024 * 1024, weigher=_get_image_byte_size
+)
+
+def get_image_cache() -> LRUCache[Hashable, Optional[skia.Image]]:
+    """Returns the process-wide cache of decoded and resized images. Its byte budget can be changed with `max_weight`."""
+    return _image_cache
+
+def load_image(source: str) -> Optional[skia.Image]:
+    """
+    Returns the decoded image of a file path or a data URI ("data:image/...;base64,...").
+    Images are cached by file path and modification time, or by data URI digest, so each source is decoded once.
+    Raises an exception if the file can't be read. Returns None if the data can't be decoded.
+    """
+    if source.startswith("data:image/"):
+        key: Hashable = ("data", hashlib.sha256(source.encode()).digest())
+        return _image_cache.get_or_create(key, lambda: _decode_data_uri(source))
+
+    path = os.path.abspath(source)
+    key = ("file", path, os.stat(path).st_mtime_ns)
+    return _image_cache.get_or_create(key, lambda: skia.Image.open(path))
+
+def get_downscaled_image(image: skia.Image, width: int, height: int) -> skia.Image:
+    """
+    Returns the image decoded at a reduced scale that is still at least width x height, if its codec supports it
+    (e.g. JPEG DCT scaling), so large images drawn in small boxes aren't decoded at their native resolution.
+    Returns the image itself if it can't be decoded at a smaller scale.
+    """
+    if width >= image.width() or height >= image.height():
+        return image
+
+    encoded_data = image.refEncodedData()
+    if encoded_data is None:
+        return image
+
+    codec = skia.Codec.MakeFromData(encoded_data)
+    # The codec doesn't apply the EXIF orientation, so only images that don't need it are decoded at a reduced scale
+    if codec is None or codec.getOrigin() != skia.EncodedOrigin.kTopLeft_EncodedOrigin:
+        return image
+
+    scaled_size = codec.getScaledDimensions(max(width / image.width(), height / image.height()))
+    if scaled_size.width() < width or scaled_size.height() < height:
+        # The codec rounded the scale down too much, only the exact scales it supports are used
+        return image
+    if (scaled_size.width(), scaled_size.height()) == (image.width(), image.height()):
+        return image
+
+    key = ("downscaled", image.uniqueID(), scaled_size.width(), scaled_size.height())
+    downscaled = _image_cache.get_or_create(
+        key, lambda: _decode_at_size(codec, scaled_size.width(), scaled_size.height(), image.colorType())
+    )
+    return downscaled if downscaled is not None else image
+
+def get_resized_image(
+        image: skia.Image, src_rect: skia.IRect, width: int, height: int, sampling: skia.SamplingOptions
+) -> Optional[skia.Image]:
+    """Returns the region `src_rect` of the image resized to width x height, cached by source image, region, size and sampling."""
+    if sampling.useCubic:
+        sampling_key: Hashable = ("cubic", sampling.cubic.B, sampling.cubic.C)
+    else:
+        sampling_key = (sampling.filter, sampling.mipmap)
+
+    key = ("resized", image.uniqueID(), (src_rect.left(), src_rect.top(), src_rect.right(), src_rect.bottom()), width, height, sampling_key)
+    return _image_cache.get_or_create(key, lambda: _resize_image(image, src_rect, width, height, sampling))
+
+def _decode_data_uri(source: str) -> Optional[skia.Image]:
+    _, encoded = source.split(",", 1)
+    return skia.Image.MakeFromEncoded(skia.Data.MakeWithCopy(base64.b64decode(encoded)))
+
+def _decode_at_size(codec: skia.Codec, width: int, height: int, color_type: skia.ColorType) -> Optional[skia.Image]:
+    # The pixels use the color type Skia decodes the full image to (drawing other color types needs a conversion per pixel),
+    # and the color space of the codec. Only translucent images are premultiplied
+    info = codec.getInfo().makeWH(width, height).makeColorType(color_type)
+    if info.alphaType() == skia.AlphaType.kUnpremul_AlphaType:
+        info = info.makeAlphaType(skia.AlphaType.kPremul_AlphaType)
+    if info.bytesPerPixel() != 4:
+        return None
+
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    result = codec.getPixels(info, pixels, info.minRowBytes())
+    if result not in (skia.Codec.Result.kSuccess, skia.Codec.Result.kIncompleteInput):
+        return None
+    return skia.Image.fromarray(pixels, colorType=info.colorType(), alphaType=info.alphaType(), colorSpace=info.colorSpace())
+
+def _resize_image(image: skia.Image, src_rect: skia.IRect, width: int, height: int, sampling: skia.SamplingOptions) -> Optional[skia.Image]:
+    subset = image.makeSubset(src_rect)
+    if subset is None:
+        return None
+    return subset.resize(width=width, height=height, options=sampling)
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+from threading import RLock
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+class LRUCache(Generic[K, V]):
+    """
+    A bounded, thread-safe mapping that evicts the least recently used entries.
+    It keeps hit/miss counters, so the effectiveness of each cache can be inspected.
+
+    Optionally, entries can be weighed (e.g. by their size in bytes) with `weigher`,
+    and entries are also evicted while the total weight is over `max_weight`.
+    """
+
+    def __init__(self, max_size: int = 128, max_weight: Optional[int] = None, weigher: Optional[Callable[[V], int]] = None):
+        if max_size < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        if max_weight is not None and max_weight < 0:
+            raise ValueError("max_weight must be a non-negative integer")
+        self._max_size = max_size
+        self._max_weight = max_weight
+        self._weigher = weigher
+        self._weights: dict[K, int] = {}
+        self._total_weight = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("max_size must be a non-negative integer")
+        with self._lock:
+            self._max_size = value
+            self._evict()
+
+    @property
+    def max_weight(self) -> Optional[int]:
+        return self._max_weight
+
+    @max_weight.setter
+    def max_weight(self, value: Optional[int]) -> None:
+        if value is not None and value < 0:
+            raise ValueError("max_weight must be a non-negative integer")
+        with self._lock:
+            self._max_weight = value
+            self._evict()
+
+    @property
+    def total_weight(self) -> int:
+        return self._total_weight
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, key: K, default=None):
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._store(key, value)
+            self._evict()
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        """
+        Returns the cached value for the key, creating and storing it with `factory` on a miss.
+        The factory runs outside the lock, so slow factories don't block other threads.
+        Any value returned by the factory is cached, including None (negative caching).
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = factory()
+        with self._lock:
+            existing = self._entries.get(key, _MISSING)
+            if existing is not _MISSING:
+                # Another thread created it in the meantime, we keep the first one
+                self._entries.move_to_end(key)
+                return existing
+            self._store(key, value)
+            self._evict()
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weights.clear()
+            self._total_weight = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _store(self, key: K, value: V) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self._weigher is not None:
+            weight = self._weigher(value)
+            self._total_weight += weight - self._weights.get(key, 0)
+            self._weights[key] = weight
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self._max_size
+            or (self._max_weight is not None and self._total_weight > self._max_weight)
+        ):
+            key, _ = self._entries.popitem(last=False)
+            self._total_weight -= self._weights.pop(key, 0)
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,6 +1,14 @@
 import skia
-from typing import Optional, Union
+from typing import Optional, Union, Hashable
 from ..models import Shadow
+from .lru_cache import LRUCache
+
+# Composed shadow filters by resolved shadow stack. Image filters are immutable, so they can be shared
+_shadow_filter_cache: LRUCache[Hashable, skia.ImageFilter] = LRUCache(max_size=256)
+
+def get_shadow_filter_cache() -> LRUCache[Hashable, skia.ImageFilter]:
+    """Returns the process-wide cache of composed shadow filters."""
+    return _shadow_filter_cache
 
 def _convert_offset_to_pixels(offset: Union[float, str], reference_size: float) -> float:
     """Convert offset to pixels. If it's a percentage string, convert based on reference_size."""
@@ -28,29 +36,33 @@ def create_composite_shadow_filter(
     if len(shadows) == 0:
         return None
 
+    # Use element dimensions for percentage conversion, fallback to 0 if not provided
+    ref_width = element_width if element_width is not None else 0
+    ref_height = element_height if element_height is not None else 0
+    resolved_shadows = tuple(
+        (
+            _convert_offset_to_pixels(shadow.offset[0], ref_width),
+            _convert_offset_to_pixels(shadow.offset[1], ref_height),
+            shadow.blur_radius,
+            (shadow.color.r, shadow.color.g, shadow.color.b, shadow.color.a),
+        )
+        for shadow in shadows
+    )
+    return _shadow_filter_cache.get_or_create(
+        (resolved_shadows, should_remove_content),
+        lambda: _compose_shadow_filters(resolved_shadows, should_remove_content)
+    )
+
+def _compose_shadow_filters(resolved_shadows: tuple, should_remove_content: bool) -> skia.ImageFilter:
     skia_shadow_filters = []
     filter = lambda **kwargs: skia.ImageFilters.DropShadowOnly(**kwargs) if should_remove_content else skia.ImageFilters.DropShadow(**kwargs)
     
-    for shadow in shadows:
-        # Convert offset to pixels if percentages are used
-        dx = shadow.offset[0]
-        dy = shadow.offset[1]
-        
-        # Use element dimensions for percentage conversion, fallback to 0 if not provided
-        ref_width = element_width if element_width is not None else 0
-        ref_height = element_height if element_height is not None else 0
-        
-        dx_px = _convert_offset_to_pixels(dx, ref_width)
-        dy_px = _convert_offset_to_pixels(dy, ref_height)
-        
+    for dx_px, dy_px, blur_radius, (r, g, b, a) in resolved_shadows:
         skia_shadow_filters.append(
             filter(
                 dx=dx_px, dy=dy_px,
-                sigmaX=shadow.blur_radius, sigmaY=shadow.blur_radius,
-                color=skia.Color(
-                    shadow.color.r, shadow.color.g,
-                    shadow.color.b, shadow.color.a
-                )
+                sigmaX=blur_radius, sigmaY=blur_radius,
+                color=skia.Color(r, g, b, a)
             )
         )
 
@@ -61,4 +73,4 @@ def create_composite_shadow_filter(
     for i in range(1, len(skia_shadow_filters)):
         composite_filter = skia.ImageFilters.Compose(skia_shadow_filters[i], composite_filter)
 
-    return composite_filter
\ No newline at end of file
+    return composite_filter
@@ -91,3 +91,59 @@ def test_background_image_with_tile_mode(file_regression, render_engine):
 
     image = render_func(Canvas(), element)
     check_func(file_regression, image)
+
+def test_background_images_are_decoded_once_across_copies():
+    from copy import deepcopy
+    import skia
+    from pictex.models import BackgroundImage
+    from pictex.utils import get_image_cache, get_resized_image
+
+    get_image_cache().clear()
+    image = BackgroundImage(IMAGE_PATH).get_skia_image()
+    assert BackgroundImage(IMAGE_PATH).get_skia_image() is image
+    assert deepcopy(BackgroundImage(IMAGE_PATH)).get_skia_image() is image
+    assert get_image_cache().misses == 1
+
+    sampling = skia.SamplingOptions(skia.FilterMode.kLinear, skia.MipmapMode.kLinear)
+    resized = get_resized_image(image, skia.IRect.MakeWH(10, 10), 5, 5, sampling)
+    assert (resized.width(), resized.height()) == (5, 5)
+    assert get_resized_image(image, skia.IRect.MakeWH(10, 10), 5, 5, sampling) is resized
+    assert get_resized_image(image, skia.IRect.MakeWH(10, 10), 6, 6, sampling) is not resized
+
+def test_sampling_background_images_from_source_matches_resized_copies():
+    import numpy as np
+    canvas = Canvas().size(300, 150).background_image(IMAGE_PATH, size_mode='cover')
+
+    sampled = canvas.render().to_numpy().astype(int)
+    resized = canvas.render(sample_images_from_source=False).to_numpy().astype(int)
+
+    assert sampled.shape == resized.shape
+    assert np.abs(sampled - resized).mean() < 2
+
+def test_large_jpeg_images_are_decoded_at_a_reduced_scale(tmp_path):
+    import numpy as np
+    import skia
+    from pictex.utils import load_image, get_downscaled_image
+
+    pixels = np.zeros((800, 1200, 4), dtype=np.uint8)
+    pixels[..., 0] = np.linspace(0, 255, 1200)[None, :]
+    pixels[..., 1] = np.linspace(0, 255, 800)[:, None]
+    pixels[..., 3] = 255
+    jpeg_path = str(tmp_path / "photo.jpg")
+    skia.Image.fromarray(pixels).save(jpeg_path, skia.kJPEG)
+
+    image = load_image(jpeg_path)
+    downscaled = get_downscaled_image(image, 100, 60)
+    assert (downscaled.width(), downscaled.height()) == (150, 100)
+    assert get_downscaled_image(image, 100, 60) is downscaled
+    assert get_downscaled_image(image, 1200, 800) is image
+    # PNG images can't be decoded at a reduced scale
+    png_image = load_image(IMAGE_PATH)
+    assert get_downscaled_image(png_image, 10, 10) is png_image
+
+    sampling = skia.SamplingOptions(skia.FilterMode.kLinear, skia.MipmapMode.kLinear)
+    def draw(source):
+        surface = skia.Surface(100, 60)
+        surface.getCanvas().drawImageRect(source, skia.Rect.MakeWH(100, 60), sampling)
+        return surface.makeImageSnapshot().toarray().astype(int)
+    assert np.abs(draw(downscaled) - draw(image)).mean() < 2
@@ -0,0 +1,51 @@
+from pictex.utils import Cacheable, cached_property, cached_method
+
+class Counter(Cacheable):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    @cached_property(group='bounds')
+    def bounds(self):
+        self.calls += 1
+        return self.calls
+
+    @cached_property()
+    def styles(self):
+        self.calls += 1
+        return self.calls
+
+    @cached_method(group='bounds')
+    def scaled(self, factor, offset=0):
+        self.calls += 1
+        return self.calls * factor + offset
+
+def test_cached_values_are_computed_once():
+    counter = Counter()
+    assert counter.bounds == counter.bounds
+    assert counter.scaled(2) == counter.scaled(2)
+    assert counter.scaled(2, offset=1) == counter.scaled(2, offset=1)
+    assert counter.calls == 3
+
+def test_clearing_a_group_keeps_the_other_groups():
+    counter = Counter()
+    bounds, styles, scaled = counter.bounds, counter.styles, counter.scaled(1)
+    counter.clear_cache('bounds')
+
+    assert counter.styles == styles
+    assert counter.bounds != bounds
+    assert counter.scaled(1) != scaled
+
+def test_clearing_everything_and_unknown_groups():
+    counter = Counter()
+    styles = counter.styles
+    counter.clear_cache('unknown')
+    assert counter.styles == styles
+
+    counter.clear_cache()
+    assert counter.styles != styles
+
+def test_caches_are_not_shared_between_instances():
+    first, second = Counter(), Counter()
+    first.bounds
+    assert second.bounds == 1
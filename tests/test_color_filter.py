@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+import skia
+from pictex.models import ImageEffects
+from pictex.utils import create_image_effects_filter
+
+def reference_effects_filter(effects):
+    """The previous filter of BackgroundPainter: one matrix filter per effect, composed in order."""
+    matrices = []
+    if effects.brightness != 100:
+        b = effects.brightness / 100.0
+        matrices.append([b, 0, 0, 0, 0, 0, b, 0, 0, 0, 0, 0, b, 0, 0, 0, 0, 0, 1, 0])
+    if effects.contrast != 100:
+        c = effects.contrast / 100.0
+        t = (1.0 - c) / 2.0
+        matrices.append([c, 0, 0, 0, t, 0, c, 0, 0, t, 0, 0, c, 0, t, 0, 0, 0, 1, 0])
+    if effects.saturation != 100:
+        s = effects.saturation / 100.0
+        r, g, b = (1.0 - s) * 0.2126, (1.0 - s) * 0.7152, (1.0 - s) * 0.0722
+        matrices.append([r + s, g, b, 0, 0, r, g + s, b, 0, 0, r, g, b + s, 0, 0, 0, 0, 0, 1, 0])
+    if effects.warmth > 0:
+        a = effects.warmth / 100.0
+        matrices.append([
+            0.393 * a + 1 - a, 0.769 * a, 0.189 * a, 0, 0,
+            0.349 * a, 0.686 * a + 1 - a, 0.168 * a, 0, 0,
+            0.272 * a, 0.534 * a, 0.131 * a + 1 - a, 0, 0,
+            0, 0, 0, 1, 0,
+        ])
+
+    color_filter = skia.ColorFilters.Matrix(matrices[0])
+    for matrix in matrices[1:]:
+        color_filter = skia.ColorFilters.Compose(skia.ColorFilters.Matrix(matrix), color_filter)
+    return color_filter
+
+def draw_with_filter(image, color_filter):
+    surface = skia.Surface(image.width(), image.height())
+    paint = skia.Paint()
+    paint.setColorFilter(color_filter)
+    surface.getCanvas().drawImage(image, 0, 0, skia.SamplingOptions(), paint)
+    return surface.makeImageSnapshot().toarray().astype(int)
+
+@pytest.fixture
+def random_image():
+    pixels = np.random.default_rng(0).integers(0, 256, (32, 32, 4), dtype=np.uint8)
+    pixels[..., 3] = 255
+    return skia.Image.fromarray(pixels)
+
+@pytest.mark.parametrize("effects", [
+    ImageEffects(brightness=80),
+    ImageEffects(brightness=80, contrast=90, saturation=50, warmth=40),
+    # Brightness over 100% is clamped before the contrast is applied
+    ImageEffects(brightness=150, contrast=60),
+    ImageEffects(contrast=140, saturation=160, warmth=100),
+    ImageEffects(brightness=120, contrast=120, saturation=0, warmth=10),
+])
+def test_fused_filter_matches_the_composed_filters(random_image, effects):
+    fused = draw_with_filter(random_image, create_image_effects_filter(effects))
+    composed = draw_with_filter(random_image, reference_effects_filter(effects))
+    # Fusing the matrices only changes the rounding of the intermediate colors
+    assert np.abs(fused - composed).max() <= 1
+
+def test_effects_filters_are_cached_by_value():
+    color_filter = create_image_effects_filter(ImageEffects(brightness=90, warmth=20))
+    assert create_image_effects_filter(ImageEffects(brightness=90, warmth=20)) is color_filter
+    assert create_image_effects_filter(ImageEffects(brightness=90, warmth=30)) is not color_filter
+    assert create_image_effects_filter(ImageEffects()) is None
+    assert create_image_effects_filter(None) is None
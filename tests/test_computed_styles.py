@@ -0,0 +1,104 @@
+import copy
+import dataclasses
+import pytest
+from dataclasses import FrozenInstanceError
+from pictex import Row, Text, Style
+from pictex.models import RenderProps, CropMode, FontSmoothing
+
+def prepare(element):
+    root = Row(element).font_size(30).color("blue").padding(10)._to_node()
+    root.prepare_tree_for_rendering(RenderProps(False, CropMode.NONE, FontSmoothing.SUBPIXEL))
+    return root
+
+def test_inherited_properties_are_shared_with_the_parent():
+    root = prepare(Row(Text("child")))
+    row = root.children[0]
+    text = row.children[0]
+
+    assert text.computed_styles.color.get() is root.computed_styles.color.get()
+    assert text.computed_styles.font_size.was_set
+    assert text.computed_styles.font_size.get() == 30
+
+def test_explicit_and_non_inheritable_properties_are_not_inherited():
+    root = prepare(Text("child").font_size(12))
+    text = root.children[0]
+
+    assert text.computed_styles.font_size.get() == 12
+    assert root.computed_styles.font_size.get() == 30
+    assert text.computed_styles.padding.get() == Style().padding.get()
+
+def test_identical_styles_share_one_interned_snapshot():
+    first = Text("a").color("red").font_size(20)._to_node()
+    second = Text("b").color("red").font_size(20)._to_node()
+    other = Text("c").color("blue").font_size(20)._to_node()
+
+    assert first.computed_styles is second.computed_styles
+    assert first.computed_styles is not other.computed_styles
+    assert len({first.computed_styles, second.computed_styles, other.computed_styles}) == 2
+
+def test_siblings_with_same_style_share_computed_styles():
+    root = prepare(Row(Text("a").color("red"), Text("b").color("red")))
+    first, second = root.children[0].children
+
+    assert first.computed_styles is second.computed_styles
+
+def test_snapshots_are_immutable():
+    snapshot = Style().freeze()
+
+    assert snapshot.is_frozen and snapshot.freeze() is snapshot
+    with pytest.raises(FrozenInstanceError):
+        snapshot.font_size.set(10)
+    with pytest.raises(TypeError):
+        hash(Style())
+
+def test_snapshots_are_not_affected_by_later_builder_changes():
+    image = Text("a").brightness(50)
+    snapshot = image._to_node().computed_styles
+    image.brightness(80)
+
+    assert snapshot.image_effects.get().brightness == 50
+    assert image._to_node().computed_styles.image_effects.get().brightness == 80
+
+def test_styles_share_default_values_until_written():
+    first, second = Style(), Style()
+    assert first.padding.get() is second.padding.get()
+
+    first.font_size.set(10)
+    assert first.font_size.was_set and first.font_size.get() == 10
+    assert not second.font_size.was_set and second.font_size.get() == 50
+
+    first.font_size.reset()
+    assert not first.is_explicit("font_size") and first.font_size.get() == 50
+
+def test_copied_elements_do_not_share_style_changes():
+    text = Text("a").font_size(10)
+    row = Row(text)
+    text.font_size(20)
+
+    assert row._children[0]._style.font_size.get() == 10
+
+def test_styles_accept_keyword_arguments_and_property_assignment():
+    style = Style(font_size=40, color=Style().color)
+    assert style.font_size.get() == 40 and style.is_explicit("font_size")
+    assert not style.is_explicit("color")
+
+    other = Style()
+    other.font_size = style.font_size
+    other.gap = 10
+    assert other == Style(font_size=40, gap=10)
+    with pytest.raises(TypeError):
+        Style(font=40)
+    with pytest.raises(FrozenInstanceError):
+        other.freeze().gap = 20
+
+def test_styles_are_no_longer_dataclasses():
+    # The dataclasses functions (fields, replace, asdict) aren't supported, use get_field_names() and copy()
+    assert not dataclasses.is_dataclass(Style())
+    with pytest.raises(TypeError):
+        dataclasses.fields(Style())
+
+    style = Style(font_size=40)
+    copied = copy.copy(style)
+    copied.font_size = 20
+    assert style.font_size.get() == 40
+    assert "font_size" in style.get_field_names()
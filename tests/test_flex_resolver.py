@@ -0,0 +1,59 @@
+import math
+import random
+import pytest
+from pictex.layout import resolve_flex_widths
+
+def reference_flex_widths(bases, min_widths, available_width):
+    """The previous allocation loop of RowNode._set_width_constraint, with ties broken by order."""
+    remaining = list(range(len(bases)))
+    remaining_available = int(available_width)
+    result = [0] * len(bases)
+
+    while remaining:
+        total_basis = sum(bases[c] for c in remaining)
+        raw_allocs = {c: (bases[c] / total_basis) * remaining_available for c in remaining}
+        allocations = {c: int(math.floor(raw_allocs[c])) for c in remaining}
+
+        leftover = remaining_available - sum(allocations.values())
+        if leftover > 0:
+            residuals = sorted(remaining, key=lambda c: (raw_allocs[c] - math.floor(raw_allocs[c])), reverse=True)
+            for c in residuals[:leftover]:
+                allocations[c] += 1
+
+        to_fix = [c for c in remaining if allocations[c] < min_widths[c]]
+        if not to_fix:
+            for c in remaining:
+                result[c] = allocations[c]
+            return result
+
+        for c in to_fix:
+            result[c] = min_widths[c]
+            remaining_available = max(remaining_available - min_widths[c], 0)
+            remaining.remove(c)
+
+    return result
+
+@pytest.mark.parametrize("bases, min_widths, available_width", [
+    ([100.0, 100.0], [0, 0], 101),
+    ([100.0, 300.0], [80, 20], 200),
+    ([50.0, 50.0, 50.0], [60, 60, 60], 100),
+    ([120.0, 80.0, 40.0], [10, 10, 10], 0),
+    ([87.0, 267.0, 27.0, 119.0, 245.0, 197.0], [3, 30, 10, 39, 12, 105], 374),
+    ([30.0] * 8, [30] * 8, 239),
+])
+def test_flex_widths_match_the_previous_allocations(bases, min_widths, available_width):
+    assert resolve_flex_widths(bases, min_widths, available_width) == reference_flex_widths(bases, min_widths, available_width)
+
+def test_flex_widths_match_the_previous_allocations_for_random_rows():
+    generator = random.Random(0)
+    for _ in range(3000):
+        count = generator.randint(1, 40)
+        bases = [float(generator.randint(1, 300)) for _ in range(count)]
+        # Single words (tags) can't be narrower than their natural width
+        min_widths = [int(basis) if generator.random() < 0.3 else generator.randint(0, 120) for basis in bases]
+        available_width = generator.randint(0, int(sum(bases) * 1.2))
+
+        assert resolve_flex_widths(bases, min_widths, available_width) == reference_flex_widths(bases, min_widths, available_width)
+
+def test_flex_widths_of_no_items():
+    assert resolve_flex_widths([], [], 100) == []
@@ -1,5 +1,7 @@
 import pytest
 from pictex import Canvas, Row, Column, Text
+from pictex.nodes import TextNode, RowNode
+from pictex.models import RenderProps, CropMode, FontSmoothing
 
 ROW_CHILDREN = [
     Text("A").font_size(20).background_color("#3498db").padding(10),
@@ -112,3 +114,124 @@ def test_column_with_gap_and_distribution(file_regression, render_engine):
     render_func, check_func = render_engine
     image = render_func(Canvas(), test_case)
     check_func(file_regression, image)
+
+def test_layout_measures_unconstrained_nodes_once(monkeypatch):
+    measured = []
+    original_measure = TextNode._compute_text_bounds
+    def counting_measure(node):
+        measured.append(node.text)
+        return original_measure(node)
+    monkeypatch.setattr(TextNode, "_compute_text_bounds", counting_measure)
+
+    root = Column(Row(Text("A"), Text("B")), Text("C")).gap(10)._to_node()
+    root.prepare_tree_for_rendering(RenderProps(False, CropMode.NONE, FontSmoothing.SUBPIXEL))
+
+    assert sorted(measured) == ["A", "B", "C"]
+
+def test_nested_fill_available_children_fill_their_parent():
+    text = Text("hello world").size(width="fill-available")
+    root = Row(Row(text).size(width="fill-available")).size(width=200)._to_node()
+    root.prepare_tree_for_rendering(RenderProps(False, CropMode.NONE, FontSmoothing.SUBPIXEL))
+
+    inner_row = root.children[0]
+    assert inner_row.margin_bounds.width() == 200
+    assert inner_row.children[0].margin_bounds.width() == 200
+
+def test_stretch_children_of_stretched_containers_fill_them():
+    render_props = RenderProps(False, CropMode.NONE, FontSmoothing.SUBPIXEL)
+    root = Column(
+        Text("hello world"),
+        Column(Text("a")).horizontal_align("stretch"),
+    ).horizontal_align("stretch")._to_node()
+    root.prepare_tree_for_rendering(render_props)
+
+    inner_column = root.children[1]
+    assert inner_column.margin_bounds.width() == root.children[0].margin_bounds.width()
+    assert inner_column.children[0].margin_bounds.width() == inner_column.margin_bounds.width()
+
+    root = Row(
+        Row(Text("a")).vertical_align("stretch"),
+        Text("two\nlines"),
+    ).vertical_align("stretch")._to_node()
+    root.prepare_tree_for_rendering(render_props)
+
+    inner_row = root.children[0]
+    assert inner_row.margin_bounds.height() == root.children[1].margin_bounds.height()
+    assert inner_row.children[0].margin_bounds.height() == inner_row.margin_bounds.height()
+
+def _layout_of(node):
+    bounds = [tuple(bound.asScalars()) for bound in node._get_all_bounds() + [node.paint_bounds]]
+    return [(bounds, node.absolute_position)] + [layout for child in node.children for layout in _layout_of(child)]
+
+def _build_cards(title):
+    return Column(
+        Row(Text(title), Text("Subtitle")).size(200, 50),
+        Row(Text("Footer"), Text("Text")).gap(10),
+    ).size(width=400).horizontal_align("stretch")
+
+def test_relayout_after_changes_matches_a_fresh_layout(monkeypatch):
+    measured = []
+    original_measure = TextNode._compute_text_bounds
+    def counting_measure(node):
+        measured.append(node.text)
+        return original_measure(node)
+    monkeypatch.setattr(TextNode, "_compute_text_bounds", counting_measure)
+    render_props = RenderProps(False, CropMode.NONE, FontSmoothing.SUBPIXEL)
+
+    root = _build_cards("Title")._to_node()
+    root.prepare_tree_for_rendering(render_props)
+    measured.clear()
+    root.prepare_tree_for_rendering(render_props)
+    assert measured == []
+
+    # The text is inside a container with absolute size, so the rest of the tree isn't laid out again
+    root.children[0].children[0].set_text("A longer title")
+    root.prepare_tree_for_rendering(render_props)
+    assert set(measured) == {"A longer title", "Subtitle"}
+
+    fresh = _build_cards("A longer title")._to_node()
+    fresh.prepare_tree_for_rendering(render_props)
+    assert _layout_of(root) == _layout_of(fresh)
+
+def test_relayout_after_style_changes_matches_a_fresh_layout():
+    render_props = RenderProps(False, CropMode.NONE, FontSmoothing.SUBPIXEL)
+    root = _build_cards("Title")._to_node()
+    root.prepare_tree_for_rendering(render_props)
+
+    root.children[1].set_style(Row().gap(30).font_size(80)._style)
+    root.prepare_tree_for_rendering(render_props)
+
+    fresh = Column(
+        Row(Text("Title"), Text("Subtitle")).size(200, 50),
+        Row(Text("Footer"), Text("Text")).gap(30).font_size(80),
+    ).size(width=400).horizontal_align("stretch")._to_node()
+    fresh.prepare_tree_for_rendering(render_props)
+    assert _layout_of(root) == _layout_of(fresh)
+
+def test_children_partition_is_cached_until_a_child_style_changes():
+    root = Row(Text("placed"), Text("positioned").absolute_position(0, 0))._to_node()
+    root.prepare_tree_for_rendering(RenderProps(False, CropMode.NONE, FontSmoothing.SUBPIXEL))
+    placed, positioned = root.children
+
+    assert root._get_positionable_children() is root._get_positionable_children()
+    assert root._get_positionable_children() == [placed]
+    assert root._get_non_positionable_children() == [positioned]
+
+    placed.set_style(Text("placed").absolute_position(10, 10)._style)
+    assert root._get_positionable_children() == []
+    assert root._get_non_positionable_children() == [placed, positioned]
+
+def test_children_positions_are_calculated_once_per_container(monkeypatch):
+    calculated = []
+    original_calculate = RowNode._calculate_children_relative_positions
+    def counting_calculate(node, children, get_child_bounds):
+        calculated.append(node)
+        return original_calculate(node, children, get_child_bounds)
+    monkeypatch.setattr(RowNode, "_calculate_children_relative_positions", counting_calculate)
+
+    root = Row(Text("A"), Row(Text("B"), Text("C"))).gap(10)._to_node()
+    root.prepare_tree_for_rendering(RenderProps(False, CropMode.NONE, FontSmoothing.SUBPIXEL))
+    root.paint_bounds
+
+    assert len(calculated) == 2
+    assert root.children[1].absolute_position == tuple(root.children_relative_positions[1])
@@ -0,0 +1,37 @@
+from pictex.utils import LRUCache
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+    cache.max_size = 1
+    assert len(cache) == 1 and "c" in cache
+
+def test_lru_cache_stores_none_results():
+    cache: LRUCache[str, None] = LRUCache()
+    calls = []
+    cache.get_or_create("key", lambda: calls.append(1))
+    cache.get_or_create("key", lambda: calls.append(1))
+
+    assert len(calls) == 1
+    assert cache.hits == 1
+
+def test_lru_cache_evicts_over_its_weight_budget():
+    cache: LRUCache[str, bytes] = LRUCache(max_size=10, max_weight=10, weigher=len)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    cache.put("a", b"12")
+    assert cache.total_weight == 6
+
+    cache.put("c", b"12345")
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.total_weight == 7
+
+    cache.max_weight = 0
+    assert len(cache) == 0 and cache.total_weight == 0
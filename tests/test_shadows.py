@@ -1,4 +1,5 @@
 from pictex import Canvas, Shadow
+from pictex.utils import create_composite_shadow_filter
 
 def test_render_with_simple_text_shadow(file_regression, render_engine):
     """
@@ -115,3 +116,15 @@ def test_hard_shadow_without_blur(file_regression, render_engine):
     render_func, check_func = render_engine
     image = render_func(canvas, "RETRO")
     check_func(file_regression, image)
+
+def test_identical_shadow_stacks_share_one_filter():
+    shadows = [Shadow(offset=(2, 2), blur_radius=3, color="black"), Shadow(offset=("10%", 0), blur_radius=0, color="red")]
+    same_shadows = [Shadow(offset=(2, 2), blur_radius=3, color="black"), Shadow(offset=("10%", 0), blur_radius=0, color="red")]
+
+    shadow_filter = create_composite_shadow_filter(shadows, element_width=100, element_height=50)
+    assert create_composite_shadow_filter(same_shadows, element_width=100, element_height=50) is shadow_filter
+    # Percentage offsets are resolved before building the key
+    assert create_composite_shadow_filter(shadows, element_width=200, element_height=50) is not shadow_filter
+    assert create_composite_shadow_filter(shadows, should_remove_content=True, element_width=100, element_height=50) is not shadow_filter
+    assert create_composite_shadow_filter([]) is None
+
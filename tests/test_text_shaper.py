@@ -0,0 +1,159 @@
+import os
+import shutil
+import pytest
+from typing import Optional
+from pictex import Canvas, Row, Style, FontSmoothing
+from pictex.text import FontManager, TextShaper, TypefaceLoader
+from pictex import utils
+from pictex.exceptions import FontNotFoundWarning
+from .conftest import STATIC_FONT_PATH, FONT_WITH_LIGATURES_PATH, VARIABLE_WGHT_FONT_PATH
+
+@pytest.fixture(autouse=True)
+def clear_shaping_cache():
+    TextShaper.clear_cache()
+    FontManager.clear_cache()
+    yield
+    TextShaper.clear_cache()
+    FontManager.clear_cache()
+
+def create_shaper(font_size: float = 40, fallbacks: Optional[list[str]] = None) -> TextShaper:
+    style = Style()
+    style.font_family.set(STATIC_FONT_PATH)
+    style.font_fallbacks.set(fallbacks if fallbacks is not None else [])
+    style.font_size.set(font_size)
+    return TextShaper(style, FontManager(style, FontSmoothing.SUBPIXEL))
+
+def test_identical_text_is_shaped_once():
+    cache = TextShaper.get_shaping_cache()
+    first = create_shaper().shape("Buy now")
+    second = create_shaper().shape("Buy now")
+
+    assert cache.misses == 1 and cache.hits == 1
+    assert [line.runs for line in first] == [line.runs for line in second]
+
+def test_cache_key_includes_wrap_width_and_font_size():
+    cache = TextShaper.get_shaping_cache()
+    create_shaper().shape("Price tag", 50)
+    create_shaper().shape("Price tag", 500)
+    create_shaper(font_size=20).shape("Price tag", 50)
+
+    assert cache.misses == 3 and cache.hits == 0
+
+def test_cached_result_is_not_affected_by_caller_mutations():
+    lines = create_shaper().shape("first\nsecond")
+    lines.clear()
+
+    assert len(create_shaper().shape("first\nsecond")) == 2
+
+def test_shaping_cache_can_be_disabled():
+    cache = TextShaper.get_shaping_cache()
+    original_max_size = cache.max_size
+    cache.max_size = 0
+    try:
+        create_shaper().shape("Brand")
+        create_shaper().shape("Brand")
+        assert cache.hits == 0 and len(cache) == 0
+    finally:
+        cache.max_size = original_max_size
+
+def test_coverage_mask_matches_glyph_lookup():
+    typeface = TypefaceLoader.load_from_file(STATIC_FONT_PATH)
+    text = "Fox 🦊 世界 \U000E0001 é"
+    mask = utils.get_supported_codepoints_mask(utils.to_codepoints(text), typeface)
+
+    assert mask.tolist() == [typeface.unicharToGlyph(ord(cp)) != 0 for cp in text]
+
+def test_runs_split_only_on_unsupported_graphemes():
+    # Superscript digits are not supported by Lato, but they are by Fira Code
+    lines = create_shaper(fallbacks=[FONT_WITH_LIGATURES_PATH]).shape("x\u2074 and y\u2074\u2075 end")
+    runs = lines[0].runs
+
+    assert [run.text for run in runs] == ["x", "\u2074", " and y", "\u2074\u2075", " end"]
+    assert [run.font.getTypeface().getFamilyName() for run in runs] == ["Lato", "Fira Code", "Lato", "Fira Code", "Lato"]
+
+def test_rewrapping_reuses_token_measurements():
+    text = "the same words wrapped at several widths"
+    shaper = create_shaper()
+    shaper.shape(text, 200)
+    measured_lines = TextShaper._line_tokens_cache.misses
+
+    lines = shaper.shape(text, 120)
+    create_shaper().shape(text, 100)
+
+    assert TextShaper._line_tokens_cache.misses == measured_lines
+    assert len(lines) > 1
+
+def test_wrapping_uses_fallback_font_widths():
+    # Lato doesn't support superscripts, and Fira Code ones are wider than Lato's missing glyph
+    text = "\u2074\u2074\u2074\u2074\u2074 \u2074\u2074\u2074\u2074\u2074"
+    shaper = create_shaper(fallbacks=[FONT_WITH_LIGATURES_PATH])
+    full_width = shaper.shape(text)[0].width
+    lines = shaper.shape(text, full_width - 1)
+
+    assert len(lines) == 2
+    assert all(line.width < full_width - 1 for line in lines)
+    assert len(shaper.shape(text, full_width)) == 1
+
+def test_wrapping_uses_shaped_advances():
+    # Lato ligatures (fi, ffi) are narrower than their letters, tokens are measured as rendered
+    text = "office affine fifth"
+    shaper = create_shaper()
+    full_width = shaper.shape(text)[0].width
+    _, token_widths = shaper._measure_tokens(text, shaper._get_line_spans(text))
+
+    assert sum(token_widths) == pytest.approx(full_width)
+    assert len(shaper.shape(text, full_width)) == 1
+    assert len(shaper.shape(text, full_width - 0.5)) == 2
+
+def test_font_managers_are_shared_by_nodes_with_same_font():
+    pool = FontManager.get_pool()
+    cells = [f"cell {i}" for i in range(20)]
+    canvas = Canvas().font_family(STATIC_FONT_PATH).font_size(20)
+    canvas.render(Row(*cells))
+    canvas.render(Row(*cells).color("red"))
+
+    assert pool.misses == 1
+    assert pool.hits == 2 * len(cells) - 1
+
+def test_font_manager_pool_key_covers_font_properties():
+    style = Style()
+    style.font_family.set(STATIC_FONT_PATH)
+    manager = FontManager.get_or_create(style, FontSmoothing.SUBPIXEL)
+
+    assert FontManager.get_or_create(style, FontSmoothing.SUBPIXEL) is manager
+    assert FontManager.get_or_create(style, FontSmoothing.STANDARD) is not manager
+    style.font_size.set(12)
+    assert FontManager.get_or_create(style, FontSmoothing.SUBPIXEL).get_primary_font().getSize() == 12
+
+def test_font_manager_pool_reloads_replaced_font_files(tmp_path):
+    font_path = str(tmp_path / "font.ttf")
+    shutil.copy(STATIC_FONT_PATH, font_path)
+    style = Style()
+    style.font_family.set(font_path)
+    manager = FontManager.get_or_create(style, FontSmoothing.SUBPIXEL)
+
+    shutil.copy(VARIABLE_WGHT_FONT_PATH, font_path)
+    modification_time = os.path.getmtime(font_path) + 10
+    os.utime(font_path, (modification_time, modification_time))
+    replaced = FontManager.get_or_create(style, FontSmoothing.SUBPIXEL)
+
+    assert replaced is not manager
+    assert replaced.get_primary_font().getTypeface().getFamilyName() == "Oswald"
+
+def test_pooled_font_managers_warn_about_missing_fonts_on_every_use():
+    style = Style()
+    style.font_family.set("A font family that does not exist")
+    with pytest.warns(FontNotFoundWarning):
+        manager = FontManager.get_or_create(style, FontSmoothing.SUBPIXEL)
+    with pytest.warns(FontNotFoundWarning):
+        assert FontManager.get_or_create(style, FontSmoothing.SUBPIXEL) is manager
+
+def test_min_content_width_is_the_longest_word_without_shaping():
+    cache = TextShaper.get_shaping_cache()
+    shaper = create_shaper()
+    min_width = shaper.get_min_content_width("a widest\nword")
+
+    assert cache.misses == 0
+    assert min_width == max(line.width for line in shaper.shape("widest"))
+    assert shaper.get_min_content_width("   ") == shaper.shape("   ")[0].width
+    assert shaper.get_min_content_width("") == 0
@@ -0,0 +1,97 @@
+import pytest
+import skia
+from pictex import Canvas
+from pictex.text import TypefaceLoader
+from .conftest import STATIC_FONT_PATH, VARIABLE_WGHT_FONT_PATH
+
+@pytest.fixture(autouse=True)
+def clear_typeface_cache():
+    TypefaceLoader.clear_cache()
+    yield
+    TypefaceLoader.clear_cache()
+
+def test_font_file_is_parsed_once():
+    cache = TypefaceLoader.get_typeface_cache()
+    first = TypefaceLoader.load_from_file(STATIC_FONT_PATH)
+    second = TypefaceLoader.load_from_file(STATIC_FONT_PATH)
+
+    assert first is second
+    assert cache.misses == 1
+    assert cache.hits == 1
+
+def test_system_font_is_cached_by_family_and_style():
+    first = TypefaceLoader.load_system_font("")
+    second = TypefaceLoader.load_system_font("")
+    assert first is second
+
+def test_variable_font_clones_are_cached_by_coordinates():
+    typeface = TypefaceLoader.load_from_file(VARIABLE_WGHT_FONT_PATH)
+    wght = int.from_bytes(b"wght", "big")
+
+    bold = TypefaceLoader.clone_with_variations(typeface, ((wght, 700.0),))
+    light = TypefaceLoader.clone_with_variations(typeface, ((wght, 300.0),))
+
+    assert bold is TypefaceLoader.clone_with_variations(typeface, ((wght, 700.0),))
+    assert bold is not light
+    assert TypefaceLoader.get_typeface_loading_info(bold).filepath == VARIABLE_WGHT_FONT_PATH
+
+def test_repeated_renders_reuse_typefaces():
+    canvas = Canvas().font_family(VARIABLE_WGHT_FONT_PATH).font_weight(700)
+    canvas.render("first")
+    misses = TypefaceLoader.get_typeface_cache().misses
+    canvas.render("second")
+    canvas.render_as_svg("third")
+
+    assert TypefaceLoader.get_typeface_cache().misses == misses
+
+def test_clear_resets_entries_and_counters():
+    TypefaceLoader.load_from_file(STATIC_FONT_PATH)
+    TypefaceLoader.clear_cache()
+    cache = TypefaceLoader.get_typeface_cache()
+
+    assert len(cache) == 0
+    assert cache.hits == 0 and cache.misses == 0
+
+def test_loading_info_registry_does_not_grow_across_renders():
+    canvas = Canvas().font_family(VARIABLE_WGHT_FONT_PATH).font_weight(700)
+    canvas.render_as_svg("first")
+    registry_size = len(TypefaceLoader._typefaces_loading_info)
+    for i in range(20):
+        canvas.render(f"render {i}")
+        canvas.render_as_svg(f"render {i}")
+
+    assert len(TypefaceLoader._typefaces_loading_info) == registry_size
+
+def test_loading_info_outlives_the_typeface_cache_entry():
+    cache = TypefaceLoader.get_typeface_cache()
+    original_max_size = cache.max_size
+    cache.max_size = 1
+    try:
+        variable_typeface = TypefaceLoader.load_from_file(VARIABLE_WGHT_FONT_PATH)
+        TypefaceLoader.load_from_file(STATIC_FONT_PATH)
+        assert len(cache) == 1
+
+        # The variable typeface was evicted from the cache, but it's still in use, so it can be cloned
+        assert TypefaceLoader.get_typeface_loading_info(variable_typeface).filepath == VARIABLE_WGHT_FONT_PATH
+        bold = TypefaceLoader.clone_with_variations(variable_typeface, ((int.from_bytes(b"wght", "big"), 700.0),))
+        assert TypefaceLoader.get_typeface_loading_info(bold).filepath == VARIABLE_WGHT_FONT_PATH
+    finally:
+        cache.max_size = original_max_size
+
+def test_system_fallback_for_grapheme_is_memoized(monkeypatch):
+    calls = []
+    original_match = TypefaceLoader._match_system_font_for_grapheme
+    def counting_match(grapheme, style):
+        calls.append(grapheme)
+        return original_match(grapheme, style)
+    monkeypatch.setattr(TypefaceLoader, "_match_system_font_for_grapheme", staticmethod(counting_match))
+
+    style = skia.FontStyle()
+    first = TypefaceLoader.load_for_grapheme("🦊", style)
+    assert TypefaceLoader.load_for_grapheme("🦊", style) is first
+    # Private use codepoints are not covered by any system font, so the miss is cached as well
+    assert TypefaceLoader.load_for_grapheme("\U0010FFFD", style) is None
+    assert TypefaceLoader.load_for_grapheme("\U0010FFFD", style) is None
+    TypefaceLoader.load_for_grapheme("🦊", skia.FontStyle.Bold())
+
+    assert calls == ["🦊", "\U0010FFFD", "🦊"]